@@ -6,30 +6,63 @@ import pandas as pd
 import csv
 import io
 import gzip
-from collections import defaultdict
+from sys import intern
 from .models import DatasetInfo, TableOfContents
 from .utils import Cache, handle_api_errors, parse_datetime
 from .exceptions import EurostatAPIError, DataParsingError, InvalidParameterError
 
+# Buffer size for reading the decompressed metabase stream. The default 8 KiB
+# buffer means far more zlib calls per byte than necessary for a multi-MB file.
+READ_BUFFER_SIZE = 128 * 1024
+
 class CatalogueAPI:
     """Handler for Eurostat Catalogue API operations."""
     
-    def __init__(self, base_url: str = "https://ec.europa.eu/eurostat/api/dissemination", 
-                 cache: Optional[Cache] = None):
+    def __init__(self, base_url: str = "https://ec.europa.eu/eurostat/api/dissemination",
+                 cache: Optional[Cache] = None,
+                 session: Optional[requests.Session] = None,
+                 metabase_expire_hours: float = float('inf')):
         self.base_url = base_url
         self.cache = cache
+        # The metabase changes at most daily upstream and costs a multi-second
+        # download, so its disk-cache slot never expires by default; pass a
+        # finite number of hours to re-enable expiry (expired entries are then
+        # revalidated with a cheap conditional request). get_metabase(
+        # refresh=True) always forces a re-fetch.
+        self.metabase_expire_hours = metabase_expire_hours
+        # Shared session (usually injected by EurostatClient) so repeated
+        # calls reuse one TCP/TLS connection instead of re-handshaking
+        self.session = session if session is not None else requests.Session()
         self._metabase_cache = None
-    
-    def get_table_of_contents(self) -> TableOfContents:
+        self._toc_cache = None
+        # Lazily built lowercase search indexes, each stored together with the
+        # object they were derived from so they self-invalidate on reload
+        self._code_lower_index = None
+        self._toc_search_index = None
+
+    def get_table_of_contents(self, refresh: bool = False) -> TableOfContents:
         """
         Get the table of contents from Eurostat in English using TXT format.
-        
+
+        The parsed TOC is memoized in memory (like the metabase), so repeated
+        lookups such as get_dataset_info don't re-read the disk cache or
+        re-download per call.
+
+        Args:
+            refresh: Whether to bypass the in-memory copy and re-fetch
+
         Returns:
             TableOfContents object with dataset information
         """
-        return self._get_toc_txt()
+        if refresh:
+            self._toc_cache = None
+
+        if self._toc_cache is None:
+            self._toc_cache = self._get_toc_txt()
+
+        return self._toc_cache
     
-    def get_metabase(self, refresh: bool = False) -> Dict[str, Dict[str, List[str]]]:
+    def get_metabase(self, refresh: bool = False) -> Dict[str, Dict[str, Tuple[str, ...]]]:
         """
         Get the metabase containing all dataset dimensions and available values.
         
@@ -37,7 +70,7 @@ class CatalogueAPI:
             refresh: Whether to refresh cached metabase data
             
         Returns:
-            Dictionary with structure: {dataset_code: {dimension: [values]}}
+            Dictionary with structure: {dataset_code: {dimension: (values, ...)}}
         """
         if refresh:
             self._metabase_cache = None
@@ -47,55 +80,156 @@ class CatalogueAPI:
         
         url = f"{self.base_url}/catalogue/metabase.txt.gz"
         
-        # Check cache first
-        if self.cache:
-            cached_data = self.cache.get(url)
-            if cached_data:
+        # Check cache first. The cache holds the columnar (dataset, dimension,
+        # value) table, which serializes far more compactly than the nested
+        # dict of millions of small strings; the nested view is rebuilt on
+        # load. Expired entries are left in place for conditional revalidation.
+        # refresh=True skips this check entirely and goes back to the server
+        # (which may still answer 304 against the stored validators).
+        if self.cache and not refresh and not self.cache.is_expired(url, expire_hours=self.metabase_expire_hours):
+            cached_data = self.cache.get(url, expire_hours=self.metabase_expire_hours)
+            if cached_data is not None:
+                if isinstance(cached_data, pd.DataFrame):
+                    cached_data = self._group_metabase(cached_data)
                 self._metabase_cache = cached_data
                 return cached_data
-        
+
         try:
             print("Downloading metabase (this may take a moment)...")
-            response = requests.get(url, stream=True)
+            response, stale = self._conditional_get(url, stream=True)
+
+            # Server confirmed the cached copy is still current
+            if response.status_code == 304 and stale is not None:
+                return self._revalidate_cached_metabase(url, stale, response)
+
             handle_api_errors(response)
-            
-            # Parse the gzipped content
-            metabase = defaultdict(lambda: defaultdict(list))
-            
-            with gzip.open(io.BytesIO(response.content), 'rt', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    parts = line.split('\t')
-                    if len(parts) >= 3:
-                        dataset_code = parts[0]
-                        dimension = parts[1]
-                        value = parts[2]
-                        
-                        metabase[dataset_code][dimension].append(value)
-            
-            # Convert defaultdict to regular dict for JSON serialization
-            metabase_dict = {}
-            for dataset_code, dimensions in metabase.items():
-                metabase_dict[dataset_code] = {}
-                for dimension, values in dimensions.items():
-                    metabase_dict[dataset_code][dimension] = values
-            
+
+            # Stream the compressed payload straight into the decompressor so
+            # we never hold the whole download in memory at once, then let the
+            # pandas C engine tokenize the tab-separated lines instead of
+            # splitting them one by one in Python.
+            response.raw.decode_content = False
+            with gzip.GzipFile(fileobj=response.raw, mode='rb') as gz, \
+                 io.BufferedReader(gz, buffer_size=READ_BUFFER_SIZE) as buffered:
+                df = pd.read_csv(
+                    buffered,
+                    sep='\t',
+                    header=None,
+                    names=['dataset', 'dimension', 'value'],
+                    dtype=str,
+                    engine='c',
+                    quoting=csv.QUOTE_NONE,
+                    on_bad_lines='skip',
+                    # Rows with extra fields (e.g. a trailing tab) must be
+                    # truncated to the first three, not index-shifted
+                    index_col=False,
+                    usecols=[0, 1, 2]
+                )
+
+            metabase_dict = self._group_metabase(df)
+
             self._metabase_cache = metabase_dict
-            
-            # Cache the result
+
+            # Cache the columnar table, not the nested dict
             if self.cache:
-                self.cache.set(url, metabase_dict)
+                self.cache.set(url, df, validators=self._response_validators(response))
             
             print(f"Metabase loaded: {len(metabase_dict):,} datasets")
             return metabase_dict
             
         except Exception as e:
             raise EurostatAPIError(f"Failed to get metabase: {e}")
-    
-    def get_dataset_dimensions_from_metabase(self, dataset_code: str) -> Dict[str, List[str]]:
+
+    def _conditional_get(self, url: str, params: Optional[Dict] = None, **kwargs) -> Tuple[requests.Response, Optional[object]]:
+        """
+        GET a URL, sending If-None-Match / If-Modified-Since when an expired
+        cache entry with stored validators exists.
+
+        Returns:
+            Tuple of (response, stale cached payload or None)
+        """
+        headers = None
+        stale = None
+
+        if self.cache:
+            validators = self.cache.get_validators(url, params)
+            if validators:
+                stale = self.cache.get(url, params, allow_expired=True)
+                if stale is not None:
+                    headers = {}
+                    if validators.get('etag'):
+                        headers['If-None-Match'] = validators['etag']
+                    if validators.get('last_modified'):
+                        headers['If-Modified-Since'] = validators['last_modified']
+
+        if params is not None:
+            kwargs['params'] = params
+
+        response = self.session.get(url, headers=headers, **kwargs)
+        return response, stale
+
+    @staticmethod
+    def _response_validators(response: requests.Response) -> Optional[Dict[str, str]]:
+        """Extract cacheable HTTP validators from a response, if present."""
+        validators = {}
+
+        etag = response.headers.get('ETag')
+        if etag:
+            validators['etag'] = etag
+
+        last_modified = response.headers.get('Last-Modified')
+        if last_modified:
+            validators['last_modified'] = last_modified
+
+        return validators or None
+
+    def _revalidate_cached_metabase(self, url: str, stale, response: requests.Response) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+        """Refresh an expired-but-unchanged metabase cache entry on a 304."""
+        # Rewrite the entry so its expiry window starts over
+        self.cache.set(url, stale, validators=self.cache.get_validators(url))
+
+        if isinstance(stale, pd.DataFrame):
+            stale = self._group_metabase(stale)
+
+        self._metabase_cache = stale
+        print(f"Metabase unchanged on server: {len(stale):,} datasets")
+        return stale
+
+    def _group_metabase(self, df: pd.DataFrame) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+        """
+        Group the columnar (dataset, dimension, value) table into the nested
+        {dataset_code: {dimension: (values, ...)}} mapping. Values are stored
+        as tuples: immutable, slice- and order-preserving, and noticeably
+        smaller than lists at metabase scale.
+
+        Incomplete rows (fewer than 3 fields) are dropped. Dimension names
+        ('geo', 'time', ...) repeat across virtually every dataset, so the key
+        strings are interned to keep one canonical object per code; the values
+        are high-cardinality and stay un-interned.
+        """
+        # Only the trailing value field can come back missing (short rows), so
+        # skip the full-frame copy dropna() would make when there is nothing
+        # to drop
+        if df['value'].isna().any():
+            df = df.dropna()
+        metabase_dict = {}
+        for (dataset_code, dimension), values in df.groupby(['dataset', 'dimension'], sort=False)['value']:
+            metabase_dict.setdefault(intern(dataset_code), {})[intern(dimension)] = tuple(values.tolist())
+        return metabase_dict
+
+    def is_metabase_cached(self) -> bool:
+        """
+        Check whether a usable metabase copy exists without fetching one:
+        either parsed in memory or fresh on disk.
+        """
+        if self._metabase_cache is not None:
+            return True
+        if self.cache:
+            url = f"{self.base_url}/catalogue/metabase.txt.gz"
+            return not self.cache.is_expired(url, expire_hours=self.metabase_expire_hours)
+        return False
+
+    def get_dataset_dimensions_from_metabase(self, dataset_code: str) -> Dict[str, Tuple[str, ...]]:
         """
         Get available dimensions and their values for a dataset from metabase.
         
@@ -132,60 +266,83 @@ class CatalogueAPI:
         Returns:
             List of matching dataset codes
         """
-        query = query.lower()
         metabase = self.get_metabase()
-        
-        matching_codes = []
-        for dataset_code in metabase.keys():
-            if query in dataset_code.lower():
-                matching_codes.append(dataset_code)
-        
-        return matching_codes
+
+        # Build the lowercase code index once per metabase load instead of
+        # calling .lower() on every code for every query
+        index = self._code_lower_index
+        if index is None or index[0] is not metabase:
+            index = (metabase, [(code.lower(), code) for code in metabase])
+            self._code_lower_index = index
+
+        query = query.lower()
+        return [code for code_lower, code in index[1] if query in code_lower]
     
     def _get_toc_txt(self) -> TableOfContents:
         """Get table of contents in text format (English only)."""
         url = f"{self.base_url}/catalogue/toc/txt"
         params = {"lang": "en"}  # Always use English
         
-        # Check cache
-        if self.cache:
+        # Check cache; expired entries are left for conditional revalidation
+        if self.cache and not self.cache.is_expired(url, params):
             cached_data = self.cache.get(url, params)
             if cached_data:
                 return cached_data
         
         try:
-            response = requests.get(url, params=params)
+            response, stale = self._conditional_get(url, params)
+
+            # Server confirmed the cached copy is still current
+            if response.status_code == 304 and stale is not None:
+                self.cache.set(url, stale, params,
+                               validators=self.cache.get_validators(url, params))
+                return stale
+
             handle_api_errors(response)
-            
-            # Parse TXT format using CSV reader
+
             datasets = []
             hierarchy = {}
             current_path = []
-            
-            # Use CSV reader to handle tab-separated values with proper quoting
-            csv_reader = csv.reader(io.StringIO(response.text), delimiter='\t', quotechar='"')
-            
-            # Skip header row
-            header = next(csv_reader, None)
-            if not header:
-                raise DataParsingError("Empty TXT response or missing header")
-            
-            for row in csv_reader:
-                if len(row) < 8:  # Ensure we have all expected columns
-                    continue
-                
-                title, code, item_type, last_update_str, last_modified_str, data_start, data_end, values_str = row[:8]
-                
+
+            # Let the pandas C engine handle quoting and tab tokenization in
+            # one pass instead of csv.reader plus per-field Python handling
+            toc_df = pd.read_csv(
+                io.StringIO(response.text),
+                sep='\t',
+                quotechar='"',
+                header=0,
+                dtype=str,
+                engine='c',
+                keep_default_na=False,
+                on_bad_lines='skip',
+                # Data rows with more fields than the header (e.g. a trailing
+                # tab) must be truncated, not promoted to an index that
+                # shifts every column
+                index_col=False
+            )
+
+            if toc_df.shape[1] < 8:  # Ensure we have all expected columns
+                toc_df = toc_df.iloc[0:0]
+                indent_levels = []
+            else:
+                toc_df = toc_df.iloc[:, :8]
+                # Calculate indentation levels (4 spaces per level) vectorized
+                # from the raw titles before stripping them
+                raw_titles = toc_df.iloc[:, 0]
+                indent_levels = ((raw_titles.str.len() - raw_titles.str.lstrip().str.len()) // 4).tolist()
+
+            for row, indent_level in zip(toc_df.itertuples(index=False, name=None), indent_levels):
+                title, code, item_type, last_update_str, last_modified_str, data_start, data_end, values_str = row
+
                 # Skip empty rows
                 if not title.strip() or not code.strip():
                     continue
-                
-                # Calculate indentation level (4 spaces per level)
-                indent_level = (len(title) - len(title.lstrip())) // 4
+
                 clean_title = title.strip()
-                
-                # Adjust current path based on indentation
-                current_path = current_path[:indent_level]
+
+                # Adjust current path based on indentation (truncate in place
+                # rather than allocating a fresh list per row)
+                del current_path[indent_level:]
                 current_path.append(code)
                 
                 # Parse dates
@@ -238,7 +395,7 @@ class CatalogueAPI:
             
             # Cache result
             if self.cache:
-                self.cache.set(url, toc, params)
+                self.cache.set(url, toc, params, validators=self._response_validators(response))
             
             return toc
             
@@ -272,66 +429,49 @@ class CatalogueAPI:
         
         # Get table of contents
         toc = self.get_table_of_contents()
-        
+
         query = query.lower()
-        
-        # Search for matching datasets
-        results = []
-        for dataset in toc.datasets:
-            # First check if dataset matches search criteria
-            matches_search = False
-            
-            # Search in title
-            if query in dataset.title.lower():
-                matches_search = True
-            # Search in description
-            elif dataset.short_description and query in dataset.short_description.lower():
-                matches_search = True
-            # Search in code
-            elif query in dataset.code.lower():
-                matches_search = True
-            
-            if not matches_search:
-                continue
-            
-            # Then check date filter if specified
-            if updated_since_date is not None:
-                if dataset.last_update is None:
-                    # Skip datasets with no update date when filter is specified
-                    continue
-                if dataset.last_update.date() < updated_since_date.date():
-                    continue
-            
-            results.append(dataset)
-        
-        # Convert to DataFrame
-        data = []
-        for dataset in results:
-            row = {
-                'code': dataset.code,
-                'title': dataset.title,
-                'type': dataset.type,
-                'last_update': dataset.last_update,
-                'last_modified': dataset.last_modified,
-                'data_start': dataset.data_start,
-                'data_end': dataset.data_end,
-                'values_count': dataset.values_count,
-                'short_description': dataset.short_description or '',
-                'unit': dataset.unit or '',
-                'source': dataset.source or ''
-            }
-            data.append(row)
-        
-        # Create DataFrame
-        df = pd.DataFrame(data)
-        
+
+        # Use the TOC's cached columnar view, extended with precomputed
+        # lowercase columns once per TOC load, so each query is a vectorized
+        # substring scan instead of a Python loop over every dataset
+        index = self._toc_search_index
+        if index is None or index[0] is not toc:
+            toc_df = toc.to_dataframe().copy()
+            # Make sure update timestamps are datetime64 (None becomes NaT),
+            # so updated_since filtering is a NumPy comparison rather than
+            # per-row Python datetime comparisons
+            toc_df['last_update'] = pd.to_datetime(toc_df['last_update'])
+            toc_df['_title_lower'] = toc_df['title'].str.lower()
+            toc_df['_desc_lower'] = toc_df['short_description'].str.lower()
+            toc_df['_code_lower'] = toc_df['code'].str.lower()
+            index = (toc, toc_df)
+            self._toc_search_index = index
+
+        toc_df = index[1]
+
+        # Match query against code, title, or description; the short code
+        # column is scanned first as it is by far the cheapest
+        mask = (
+            toc_df['_code_lower'].str.contains(query, regex=False)
+            | toc_df['_title_lower'].str.contains(query, regex=False)
+            | toc_df['_desc_lower'].str.contains(query, regex=False)
+        )
+
+        # Apply date filter if specified (datasets with no update date are
+        # excluded when a filter is given)
+        if updated_since_date is not None:
+            mask &= toc_df['last_update'].notna() & (toc_df['last_update'] >= updated_since_date)
+
+        df = toc_df[mask].drop(columns=['_title_lower', '_desc_lower', '_code_lower'])
+
         # Sort by last_update descending (most recent first), handling None values
         if not df.empty:
             df = df.sort_values('last_update', ascending=False, na_position='last')
-        
+
         # Limit results
         df = df.head(max_results)
-        
+
         return df.reset_index(drop=True)
     
     def get_dataset_info(self, dataset_code: str) -> Optional[DatasetInfo]:
@@ -345,9 +485,4 @@ class CatalogueAPI:
             DatasetInfo object if found, None otherwise
         """
         toc = self.get_table_of_contents()
-        
-        for dataset in toc.datasets:
-            if dataset.code == dataset_code:
-                return dataset
-        
-        return None
\ No newline at end of file
+        return toc.dataset_by_code(dataset_code)
\ No newline at end of file
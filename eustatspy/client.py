@@ -1,15 +1,27 @@
 """Main client class for the EustatsPy package."""
 
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 import pandas as pd
+import requests
+import sys
 import warnings
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
 from .catalogue import CatalogueAPI
 from .statistics import StatisticsAPI
 from .models import Dataset, DatasetInfo, TableOfContents
 from .utils import Cache
 from .exceptions import EurostatAPIError, InvalidParameterError
 
+# Only advertise brotli when a decoder is importable, otherwise urllib3
+# could not decompress what the server sends back
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
 class EurostatClient:
     """
     Main client for accessing Eurostat APIs.
@@ -22,31 +34,74 @@ class EurostatClient:
                  base_url: str = "https://ec.europa.eu/eurostat/api/dissemination",
                  cache_enabled: bool = False,
                  cache_dir: str = ".eustatspy_cache",
-                 cache_expire_hours: int = 24):
+                 cache_expire_hours: int = 24,
+                 metabase_expire_hours: float = float('inf'),
+                 max_retries: int = 3,
+                 retry_backoff: float = 0.5):
         """
         Initialize the Eurostat client.
-        
+
         Args:
             base_url: Base URL for Eurostat APIs
             cache_enabled: Whether to enable caching
             cache_dir: Directory for cache files
             cache_expire_hours: Hours after which cache expires
+            metabase_expire_hours: Expiry for the cached metabase slot.
+                Defaults to never: the metabase changes at most daily but
+                costs a multi-second download, so forcing a refetch every
+                cache_expire_hours penalizes long-running sessions for no
+                benefit. Pass a finite number of hours to opt back in.
+            max_retries: Retries for transient failures (connection errors
+                and 429/5xx responses); 0 disables retrying
+            retry_backoff: Backoff factor between retries (0.5 sleeps
+                0.5s, 1s, 2s, ... before successive attempts)
         """
         self.base_url = base_url
         
         # Initialize cache
         self.cache = Cache(cache_dir, cache_expire_hours) if cache_enabled else None
-        
+
+        # One shared session with a connection pool so every API call reuses
+        # the same TCP/TLS connections to ec.europa.eu instead of
+        # re-handshaking per request
+        self._session = requests.Session()
+        # Transient 429/5xx responses and dropped connections are retried
+        # with exponential backoff (Retry-After headers are honored), so
+        # brief Eurostat hiccups don't surface as hard failures
+        retry_policy = Retry(
+            total=max_retries,
+            backoff_factor=retry_backoff,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=64,
+                              max_retries=retry_policy)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # JSON-stat and TOC responses are highly compressible text; make the
+        # accepted codings explicit (brotli included when available)
+        self._session.headers['Accept-Encoding'] = _ACCEPT_ENCODING
+
         # Initialize API handlers
-        self.catalogue = CatalogueAPI(base_url, self.cache)
-        self.statistics = StatisticsAPI(base_url, self.cache)
+        self.catalogue = CatalogueAPI(base_url, self.cache, session=self._session,
+                                      metabase_expire_hours=metabase_expire_hours)
+        self.statistics = StatisticsAPI(base_url, self.cache, session=self._session)
         
         # Set catalogue reference in statistics API for metabase access
         self.statistics.set_catalogue_reference(self.catalogue)
         
         # Cache for table of contents
         self._toc_cache = None
-    
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "EurostatClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def get_table_of_contents(self, refresh: bool = False) -> TableOfContents:
         """
         Get the table of contents showing all available datasets in English.
@@ -61,8 +116,8 @@ class EurostatClient:
             self._toc_cache = None
         
         if self._toc_cache is None:
-            self._toc_cache = self.catalogue.get_table_of_contents()
-        
+            self._toc_cache = self.catalogue.get_table_of_contents(refresh=refresh)
+
         return self._toc_cache
     
     def search_datasets(self, 
@@ -170,6 +225,61 @@ class EurostatClient:
         """
         return self.statistics.get_data_as_dataframe(dataset_code, **filters)
     
+    def get_many_as_dataframes(self,
+                               dataset_codes: List[str],
+                               max_workers: int = 10,
+                               **filters) -> Dict[str, pd.DataFrame]:
+        """
+        Get several datasets as pandas DataFrames with concurrent requests.
+
+        Fetching datasets one by one pays a full network round-trip per call.
+        Since the work is I/O-bound, the requests are dispatched on a small
+        thread pool so the round-trips overlap instead of adding up.
+
+        Args:
+            dataset_codes: Dataset codes to retrieve
+            max_workers: Maximum number of requests in flight (default: 10,
+                kept modest to respect API limits)
+            **filters: Filter parameters applied to every dataset
+                (same as get_data_as_dataframe)
+
+        Returns:
+            Dictionary mapping each dataset code to its DataFrame,
+            in the same order as dataset_codes
+
+        Example:
+            dfs = client.get_many_as_dataframes(
+                ['nama_10_gdp', 'demo_pjan'],
+                geo='SE',
+                lastTimePeriod=3
+            )
+            gdp_df = dfs['nama_10_gdp']
+        """
+        return self.statistics.get_many_as_dataframes(
+            dataset_codes, max_workers=max_workers, **filters
+        )
+
+    def get_data_as_dataframes(self,
+                               dataset_codes: List[str],
+                               **filters) -> Dict[str, pd.DataFrame]:
+        """
+        Batch counterpart of get_data_as_dataframe for several dataset codes.
+
+        The Eurostat Statistics API only serves one dataset per request, so
+        there is no true multi-code query to issue; instead the per-code
+        requests are overlapped on a thread pool (see get_many_as_dataframes),
+        which removes the N sequential round-trips a plain loop would pay.
+
+        Args:
+            dataset_codes: Dataset codes to retrieve
+            **filters: Filter parameters applied to every dataset
+
+        Returns:
+            Dictionary mapping each dataset code to its DataFrame,
+            in the same order as dataset_codes
+        """
+        return self.get_many_as_dataframes(dataset_codes, **filters)
+
     def get_raw_data(self, dataset_code: str, **filters) -> Dict[str, Any]:
         """
         Get raw JSON-stat data from Eurostat.
@@ -183,7 +293,7 @@ class EurostatClient:
         """
         return self.statistics.get_data(dataset_code, **filters)
     
-    def get_available_filters(self, dataset_code: str) -> Dict[str, List[str]]:
+    def get_available_filters(self, dataset_code: str) -> Dict[str, Tuple[str, ...]]:
         """
         Get available filter values for each dimension of a dataset using Metabase.
         
@@ -210,98 +320,113 @@ class EurostatClient:
             show_all_for_dimension: Dimension name to show all available values for
             max_values_per_dimension: Maximum values to show per dimension (default: 10)
         """
-        # Get basic info from table of contents
-        info = self.get_dataset_info(dataset_code)
-        
-        # Get dimension information from metabase
-        try:
-            metabase_filters = self.catalogue.get_dataset_dimensions_from_metabase(dataset_code)
-        except Exception as e:
-            print(f"Error loading dataset '{dataset_code}': {e}")
-            return
-        
+        # Buffer the report and emit it with a single write at the end;
+        # per-line print calls flush line-buffered stdout dozens of times
+        # per description
+        lines = []
+
+        # Fetch TOC info and metabase dimensions concurrently: the two
+        # lookups are independent and I/O-bound, so a cold cache pays one
+        # round-trip of latency instead of two
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            info_future = executor.submit(self.get_dataset_info, dataset_code)
+            meta_future = executor.submit(
+                self.catalogue.get_dataset_dimensions_from_metabase, dataset_code
+            )
+
+            # Basic info from table of contents
+            info = info_future.result()
+
+            # Dimension information from metabase
+            try:
+                metabase_filters = meta_future.result()
+            except Exception as e:
+                print(f"Error loading dataset '{dataset_code}': {e}")
+                return
+
         # If dataset not found in TOC but exists in metabase
         if info is None and metabase_filters:
-            print(f"Dataset '{dataset_code}' found in metabase but not in table of contents.")
-            print("This may be a valid dataset code that's not publicly listed.")
+            lines.append(f"Dataset '{dataset_code}' found in metabase but not in table of contents.")
+            lines.append("This may be a valid dataset code that's not publicly listed.")
             # Create a minimal info object
             info = DatasetInfo(code=dataset_code, title=dataset_code, type="dataset")
         elif info is None and not metabase_filters:
             print(f"Dataset '{dataset_code}' not found.")
             return
-        
+
         # Display basic information
-        print(f"Dataset: {dataset_code}")
-        print("=" * 50)
-        print(f"Title: {info.title}")
-        
+        lines.append(f"Dataset: {dataset_code}")
+        lines.append("=" * 50)
+        lines.append(f"Title: {info.title}")
+
         if info.short_description:
-            print(f"Description: {info.short_description}")
-        
-        print(f"Type: {info.type}")
-        
+            lines.append(f"Description: {info.short_description}")
+
+        lines.append(f"Type: {info.type}")
+
         if info.last_update:
-            print(f"Last Updated: {info.last_update}")
+            lines.append(f"Last Updated: {info.last_update}")
         if info.data_start and info.data_end:
-            print(f"Data Period: {info.data_start} - {info.data_end}")
+            lines.append(f"Data Period: {info.data_start} - {info.data_end}")
         if info.values_count:
-            print(f"Number of Values: {info.values_count:,}")
+            lines.append(f"Number of Values: {info.values_count:,}")
         if info.unit:
-            print(f"Unit: {info.unit}")
+            lines.append(f"Unit: {info.unit}")
         if info.source:
-            print(f"Source: {info.source}")
-        
+            lines.append(f"Source: {info.source}")
+
         # Display dimensions and filters
         if not metabase_filters:
-            print("\nNo dimension information available.")
+            lines.append("\nNo dimension information available.")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
-        
-        print(f"\nAvailable Dimensions and Filters:")
-        print("-" * 35)
-        print(f"(Found {len(metabase_filters)} dimensions in metabase)")
-        
+
+        lines.append(f"\nAvailable Dimensions and Filters:")
+        lines.append("-" * 35)
+        lines.append(f"(Found {len(metabase_filters)} dimensions in metabase)")
+
         for dim_name, available_values in metabase_filters.items():
-            print(f"\n{dim_name}:")
-            
+            lines.append(f"\n{dim_name}:")
+
             # Determine if we should show all values for this dimension
             show_all = (
                 show_all_for_dimension == dim_name or  # User specifically requested this dimension
                 len(available_values) <= max_values_per_dimension  # Small enough to show all
             )
-            
+
             if show_all:
                 # Show all values
-                for value in available_values:
-                    print(f"  - {value}")
-                
+                lines.extend(f"  - {value}" for value in available_values)
+
                 if len(available_values) > max_values_per_dimension:
-                    print(f"  (Showing all {len(available_values)} values)")
+                    lines.append(f"  (Showing all {len(available_values)} values)")
             else:
                 # Show limited values with option to see all
-                for value in available_values[:max_values_per_dimension]:
-                    print(f"  - {value}")
-                
+                lines.extend(f"  - {value}" for value in available_values[:max_values_per_dimension])
+
                 remaining = len(available_values) - max_values_per_dimension
                 if remaining > 0:
-                    print(f"  ... and {remaining} more values")
-                    print(f"  (Use show_all_for_dimension='{dim_name}' to see all {len(available_values)} values)")
-        
+                    lines.append(f"  ... and {remaining} more values")
+                    lines.append(f"  (Use show_all_for_dimension='{dim_name}' to see all {len(available_values)} values)")
+
         # Display metadata URLs if available
         if info and info.metadata_urls:
-            print(f"\nMetadata URLs:")
+            lines.append(f"\nMetadata URLs:")
             for format_type, url in info.metadata_urls.items():
-                print(f"  {format_type}: {url}")
-        
+                lines.append(f"  {format_type}: {url}")
+
         # Usage tips
         if show_all_for_dimension:
-            print(f"\nNote: Showing all values for dimension '{show_all_for_dimension}' as requested.")
+            lines.append(f"\nNote: Showing all values for dimension '{show_all_for_dimension}' as requested.")
         else:
-            print(f"\nTip: Use show_all_for_dimension='dimension_name' to see all available values for a specific dimension.")
-            print(f"     Example: client.describe_dataset('{dataset_code}', show_all_for_dimension='geo')")
-        
-        print("\nNote: Dimension information from metabase (comprehensive, fast, no labels).")
+            lines.append(f"\nTip: Use show_all_for_dimension='dimension_name' to see all available values for a specific dimension.")
+            lines.append(f"     Example: client.describe_dataset('{dataset_code}', show_all_for_dimension='geo')")
+
+        lines.append("\nNote: Dimension information from metabase (comprehensive, fast, no labels).")
+
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def preload_metabase(self, show_progress: bool = True) -> Dict[str, Dict[str, List[str]]]:
+    def preload_metabase(self, show_progress: bool = True) -> Dict[str, Dict[str, Tuple[str, ...]]]:
         """
         Pre-load the metabase for optimal performance.
         
@@ -339,20 +464,25 @@ class EurostatClient:
     
     def is_metabase_loaded(self) -> bool:
         """
-        Check if metabase is already loaded in memory.
-        
+        Check if the metabase is already available without a download:
+        loaded in memory, or cached fresh on disk (the disk copy is read
+        locally on first use instead of re-fetched).
+
         Returns:
-            True if metabase is loaded, False otherwise
+            True if metabase is available, False otherwise
         """
-        return self.catalogue._metabase_cache is not None
+        return self.catalogue.is_metabase_cached()
     
     def clear_cache(self) -> None:
         """Clear all cached data."""
         if self.cache:
             self.cache.clear()
         self._toc_cache = None
-        # Clear metabase cache
+        # Clear in-memory metabase, TOC and response copies
         self.catalogue._metabase_cache = None
+        self.catalogue._toc_cache = None
+        self.statistics._json_cache.clear()
+        self.statistics._df_cache.clear()
         print("Cache cleared successfully.")
     
     def browse_database(self, parent_code: Optional[str] = None, max_items: int = 20) -> None:
@@ -369,71 +499,72 @@ class EurostatClient:
         if parent_code is None:
             parent_code = "data"
         
-        # Show specific folder contents
-        parent_dataset = next((d for d in toc.datasets if d.code == parent_code), None)
+        # Show specific folder contents (O(1) via the TOC's code index
+        # instead of scanning the full dataset list)
+        parent_dataset = toc.dataset_by_code(parent_code)
         if parent_dataset is None:
             print(f"Folder '{parent_code}' not found.")
             return
         
         parent_title = parent_dataset.title
-        
+
+        # Buffered like describe_dataset: collect lines, write once
+        lines = []
+
         # Special display for data folder (root)
         if parent_code == "data":
-            print(f"Eurostat Database - Main Themes:")
-            print("=" * 50)
+            lines.append(f"Eurostat Database - Main Themes:")
+            lines.append("=" * 50)
         else:
-            print(f"📁 {parent_code}: {parent_title}")
-            print("=" * 60)
-        
+            lines.append(f"📁 {parent_code}: {parent_title}")
+            lines.append("=" * 60)
+
         if parent_code not in toc.hierarchy:
-            print("This folder has no subfolders or datasets.")
+            lines.append("This folder has no subfolders or datasets.")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
-        # Show direct children only
-        children = toc.hierarchy[parent_code][:max_items]
-        
-        folders = []
-        datasets = []
-        
-        for child_code in children:
-            child_dataset = next((d for d in toc.datasets if d.code == child_code), None)
-            if child_dataset:
-                if child_dataset.type == "folder":
-                    folders.append(child_dataset)
-                else:
-                    datasets.append(child_dataset)
+        # Show direct children only, folders first, via the TOC's memoized
+        # per-parent partition instead of re-classifying on every browse
+        children = toc.hierarchy[parent_code]
+        all_folders, all_datasets = toc.children_by_type(parent_code)
+
+        folders = all_folders[:max_items]
+        datasets = all_datasets[:max_items - len(folders)]
         
         # Show folders first
         if folders:
             folder_icon = "📊" if parent_code == "data" else "📁"
             folder_label = "Themes" if parent_code == "data" else "Folders"
-            print(f"{folder_icon} {folder_label}:")
+            lines.append(f"{folder_icon} {folder_label}:")
             for folder in folders:
                 title = folder.title
                 child_count = len(toc.hierarchy.get(folder.code, []))
-                print(f"  📁 {folder.code}: {title} ({child_count} items)")
-        
+                lines.append(f"  📁 {folder.code}: {title} ({child_count} items)")
+
         # Then show datasets/tables
         if datasets:
-            print(f"\n📄 Datasets and Tables:")
+            lines.append(f"\n📄 Datasets and Tables:")
             for dataset in datasets:
                 title = dataset.title
                 # Add some metadata if available
                 metadata = []
                 if dataset.last_update:
-                    metadata.append(f"Updated: {dataset.last_update.strftime('%Y-%m-%d')}")
+                    metadata.append(f"Updated: {dataset.last_update_str}")
                 if dataset.values_count:
-                    metadata.append(f"{dataset.values_count:,} values")
-                
+                    metadata.append(f"{dataset.values_count_str} values")
+
                 meta_str = f" ({', '.join(metadata)})" if metadata else ""
-                print(f"  📄 {dataset.code}: {title}{meta_str}")
-        
+                lines.append(f"  📄 {dataset.code}: {title}{meta_str}")
+
         total_shown = len(folders) + len(datasets)
         total_available = len(children)
-        
+
         if total_available > max_items:
-            print(f"\nShowing {total_shown} of {total_available} items. Use max_items parameter to see more.")
+            lines.append(f"\nShowing {total_shown} of {total_available} items. Use max_items parameter to see more.")
         else:
-            print(f"\nShowing all {total_shown} items in this folder.")
-        
-        print(f"\nUse browse_database('folder_code') to explore subfolders or describe_dataset('dataset_code') for dataset details.")
+            lines.append(f"\nShowing all {total_shown} items in this folder.")
+
+        lines.append(f"\nUse browse_database('folder_code') to explore subfolders or describe_dataset('dataset_code') for dataset details.")
+
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -1,12 +1,20 @@
 """Data models for the EustatsPy package."""
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
+import pandas as pd
 
-@dataclass
+@dataclass(frozen=True)
 class DatasetInfo:
-    """Information about a Eurostat dataset."""
+    """
+    Information about a Eurostat dataset.
+
+    Frozen: instances are created once per TOC/metabase parse and shared by
+    the code indexes, so immutability keeps them safely hashable.
+    (slots=True would shrink them further but needs Python 3.10+,
+    above this package's floor.)
+    """
     code: str
     title: str  # English title only
     type: str  # 'dataset' or 'table'
@@ -21,6 +29,29 @@ class DatasetInfo:
     metadata_urls: Optional[Dict[str, str]] = None
     download_urls: Optional[Dict[str, str]] = None
 
+    # The two formatted strings below are lazily cached in the instance
+    # __dict__ (bypassing the frozen guard), since the same TOC entries get
+    # re-rendered across repeated browse calls. functools.cached_property
+    # would do the same but needs Python 3.8+.
+
+    @property
+    def last_update_str(self) -> str:
+        """last_update formatted as YYYY-MM-DD ('' when unset), cached."""
+        cached = self.__dict__.get('_last_update_str')
+        if cached is None:
+            cached = self.last_update.strftime('%Y-%m-%d') if self.last_update else ''
+            self.__dict__['_last_update_str'] = cached
+        return cached
+
+    @property
+    def values_count_str(self) -> str:
+        """values_count with thousands separators ('' when unset), cached."""
+        cached = self.__dict__.get('_values_count_str')
+        if cached is None:
+            cached = f"{self.values_count:,}" if self.values_count else ''
+            self.__dict__['_values_count_str'] = cached
+        return cached
+
 @dataclass 
 class Dataset:
     """A complete dataset with metadata and data."""
@@ -34,4 +65,61 @@ class TableOfContents:
     """Table of contents structure."""
     datasets: List[DatasetInfo]
     hierarchy: Dict[str, List[str]]  # folder -> list of child codes
-    creation_date: Optional[datetime] = None
\ No newline at end of file
+    creation_date: Optional[datetime] = None
+
+    def dataset_by_code(self, code: str) -> Optional[DatasetInfo]:
+        """
+        Look up a dataset by code via a lazily built {code: DatasetInfo}
+        index instead of scanning the dataset list.
+        """
+        by_code = getattr(self, '_by_code', None)
+        if by_code is None:
+            by_code = {d.code: d for d in self.datasets}
+            self._by_code = by_code
+        return by_code.get(code)
+
+    def children_by_type(self, parent_code: str) -> Tuple[List[DatasetInfo], List[DatasetInfo]]:
+        """
+        Partition a folder's direct children into (folders, datasets),
+        resolved to DatasetInfo objects. Memoized per parent, since the TOC
+        is immutable for the session and browsing revisits the same folders.
+        """
+        partitions = getattr(self, '_children_by_type', None)
+        if partitions is None:
+            partitions = {}
+            self._children_by_type = partitions
+
+        cached = partitions.get(parent_code)
+        if cached is None:
+            folders = []
+            datasets = []
+            for code in self.hierarchy.get(parent_code, []):
+                child = self.dataset_by_code(code)
+                if child is not None:
+                    (folders if child.type == "folder" else datasets).append(child)
+            cached = (folders, datasets)
+            partitions[parent_code] = cached
+        return cached
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Columnar (struct-of-arrays) view of the datasets, built lazily and
+        cached so repeated searches avoid re-walking the DatasetInfo objects.
+        """
+        df = getattr(self, '_datasets_df', None)
+        if df is None:
+            df = pd.DataFrame({
+                'code': [d.code for d in self.datasets],
+                'title': [d.title for d in self.datasets],
+                'type': [d.type for d in self.datasets],
+                'last_update': [d.last_update for d in self.datasets],
+                'last_modified': [d.last_modified for d in self.datasets],
+                'data_start': [d.data_start for d in self.datasets],
+                'data_end': [d.data_end for d in self.datasets],
+                'values_count': [d.values_count for d in self.datasets],
+                'short_description': [d.short_description or '' for d in self.datasets],
+                'unit': [d.unit or '' for d in self.datasets],
+                'source': [d.source or '' for d in self.datasets],
+            })
+            self._datasets_df = df
+        return df
\ No newline at end of file
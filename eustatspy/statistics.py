@@ -1,23 +1,47 @@
 """Statistics API functionality for retrieving actual data."""
 
-import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Union, Tuple
+from urllib.parse import urlencode
 import requests
 import pandas as pd
 import numpy as np
 from .models import Dataset, DatasetInfo
-from .utils import Cache, handle_api_errors, validate_geo_level
+import json
+from .utils import Cache, handle_api_errors, json_loads, validate_geo_level
 from .exceptions import EurostatAPIError, DataParsingError, InvalidParameterError
 
+# (connect, read) timeout: fail fast on unreachable hosts but leave room
+# for the server to assemble large extractions
+DEFAULT_TIMEOUT = (5, 60)
+
 class StatisticsAPI:
     """Handler for Eurostat Statistics API operations."""
     
-    def __init__(self, base_url: str = "https://ec.europa.eu/eurostat/api/dissemination", 
-                 cache: Optional[Cache] = None):
+    def __init__(self, base_url: str = "https://ec.europa.eu/eurostat/api/dissemination",
+                 cache: Optional[Cache] = None,
+                 session: Optional[requests.Session] = None):
         self.base_url = base_url
         self.cache = cache
+        # Shared session (usually injected by EurostatClient) so repeated
+        # calls reuse one TCP/TLS connection instead of re-handshaking
+        self.session = session if session is not None else requests.Session()
         # Reference to catalogue API will be set by parent client
         self.catalogue = None
+        # Small in-process LRU in front of the disk cache, keyed by the
+        # (url, sorted params) tuple so repeat requests skip hashing,
+        # file I/O and unpickling entirely
+        self._json_cache = OrderedDict()
+        self._json_cache_max = 32
+        # Companion LRU for parsed DataFrames, so repeat
+        # get_data_as_dataframe calls skip the rebuild as well
+        self._df_cache = OrderedDict()
+        self._df_cache_max = 32
+        # get_many_as_dataframes touches both LRUs from worker threads, so
+        # lookups and evictions are serialized under one lock
+        self._cache_lock = threading.Lock()
     
     def set_catalogue_reference(self, catalogue):
         """Set reference to catalogue API for metabase access."""
@@ -35,29 +59,37 @@ class StatisticsAPI:
             Raw JSON-stat response as dictionary
         """
         url = f"{self.base_url}/statistics/1.0/data/{dataset_code}"
-        
-        # Build parameters - now returns list of tuples to handle multiple values
-        params = self._build_params(**kwargs)
-        
+
+        # Build parameters - list of tuples to handle multiple values.
+        # Sorted once up front: the same list keys the in-memory layer,
+        # derives the string cache key and goes out on the wire (the API
+        # doesn't care about query-parameter order).
+        params = sorted(self._build_params(**kwargs))
+        mem_key = (url, tuple(params))
+        with self._cache_lock:
+            cached_data = self._json_cache.get(mem_key)
+            if cached_data is not None:
+                self._json_cache.move_to_end(mem_key)
+                return cached_data
+
         # Create cache key from the final URL with parameters
         cache_key = self._create_cache_key(url, params)
-        
-        # Check cache
+
+        # Check disk cache
         if self.cache:
             cached_data = self.cache.get(cache_key)
             if cached_data:
+                self._remember_json(mem_key, cached_data)
                 return cached_data
-        
+
         try:
-            # Handle both dictionary and list of tuples parameters
-            if isinstance(params, list):
-                response = requests.get(url, params=params)
-            else:
-                response = requests.get(url, params=params)
-            
+            response = self.session.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+
             handle_api_errors(response)
-            
-            data = response.json()
+
+            # Decode from the raw bytes so the optional orjson fast path
+            # applies (response.json() always goes through the stdlib)
+            data = json_loads(response.content)
             
             # Handle asynchronous response
             if 'warning' in data and data['warning'].get('status') == 413:
@@ -67,12 +99,14 @@ class StatisticsAPI:
                 )
             
             # Cache the result
+            self._remember_json(mem_key, data)
             if self.cache:
                 self.cache.set(cache_key, data)
-            
+
             return data
             
-        except requests.exceptions.JSONDecodeError as e:
+        except json.JSONDecodeError as e:
+            # Covers the stdlib and orjson decoders alike
             raise DataParsingError(f"Failed to parse JSON response: {e}")
         except Exception as e:
             raise EurostatAPIError(f"Failed to get data: {e}")
@@ -88,10 +122,71 @@ class StatisticsAPI:
         Returns:
             pandas DataFrame with the data
         """
+        url = f"{self.base_url}/statistics/1.0/data/{dataset_code}"
+        params = sorted(self._build_params(**kwargs))
+        mem_key = (url, tuple(params))
+
+        # In-process hit: hand back a shallow copy of the built frame so
+        # callers can add/drop columns without touching the cached one
+        with self._cache_lock:
+            cached_df = self._df_cache.get(mem_key)
+            if cached_df is not None:
+                self._df_cache.move_to_end(mem_key)
+                return cached_df.copy(deep=False)
+
+        # Disk cache holds the parsed DataFrame under its own key: a pickled
+        # frame reloads as a few typed column blocks, skipping both the
+        # raw-JSON unpickle and the JSON-stat conversion. The raw response
+        # stays cached separately for get_data callers.
+        df_key = None
+        if self.cache:
+            df_key = self._create_cache_key(url, params) + '#dataframe'
+            cached_df = self.cache.get(df_key)
+            if cached_df is not None:
+                self._lru_store(self._df_cache, mem_key, cached_df, self._df_cache_max)
+                return cached_df.copy(deep=False)
+
         json_data = self.get_data(dataset_code, **kwargs)
-        return self._jsonstat_to_dataframe(json_data)
+        df = self._jsonstat_to_dataframe(json_data)
+
+        self._lru_store(self._df_cache, mem_key, df, self._df_cache_max)
+        if df_key is not None:
+            self.cache.set(df_key, df)
+
+        return df.copy(deep=False)
     
-    def get_available_filters(self, dataset_code: str) -> Dict[str, List[str]]:
+    def get_many_as_dataframes(self,
+                               dataset_codes: List[str],
+                               max_workers: int = 8,
+                               **kwargs) -> Dict[str, pd.DataFrame]:
+        """
+        Get several datasets as DataFrames with concurrent requests.
+
+        Each call is dominated by the network round-trip, so the per-code
+        requests are dispatched on a thread pool sharing this API's session
+        (and both cache layers); the round-trips overlap instead of adding
+        up. The session's connection pool is sized to cover the workers.
+
+        Args:
+            dataset_codes: Dataset codes to retrieve
+            max_workers: Maximum number of requests in flight (default: 8)
+            **kwargs: Filter parameters applied to every dataset
+
+        Returns:
+            Dictionary mapping each dataset code to its DataFrame,
+            in the same order as dataset_codes
+        """
+        if not dataset_codes:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(dataset_codes))) as executor:
+            futures = [
+                executor.submit(self.get_data_as_dataframe, code, **kwargs)
+                for code in dataset_codes
+            ]
+            return {code: future.result() for code, future in zip(dataset_codes, futures)}
+
+    def get_available_filters(self, dataset_code: str) -> Dict[str, Tuple[str, ...]]:
         """
         Get available filter values for each dimension using Metabase.
         
@@ -107,6 +202,18 @@ class StatisticsAPI:
             return self.catalogue.get_dataset_dimensions_from_metabase(dataset_code)
         
     
+    def _remember_json(self, mem_key: Tuple, data: Dict[str, Any]) -> None:
+        """Store a response in the in-memory LRU, evicting the oldest entry."""
+        self._lru_store(self._json_cache, mem_key, data, self._json_cache_max)
+
+    def _lru_store(self, lru: OrderedDict, key: Tuple, value: Any, max_entries: int) -> None:
+        """Insert into an OrderedDict-backed LRU, evicting oldest entries."""
+        with self._cache_lock:
+            lru[key] = value
+            lru.move_to_end(key)
+            while len(lru) > max_entries:
+                lru.popitem(last=False)
+
     def _build_params(self, **kwargs) -> List[Tuple[str, str]]:
         """
         Build API parameters from keyword arguments.
@@ -175,10 +282,10 @@ class StatisticsAPI:
     
     def _create_cache_key(self, url: str, params: List[Tuple[str, str]]) -> str:
         """Create a consistent cache key from URL and parameters."""
-        # Sort parameters to ensure consistent caching
-        sorted_params = sorted(params)
-        param_string = '&'.join([f"{k}={v}" for k, v in sorted_params])
-        return f"{url}?{param_string}"
+        # Sorting normalizes parameter order (a no-op for the already-sorted
+        # lists the fetch paths pass in); urlencode builds the query string
+        # in one C-level pass and matches the form requests puts on the wire
+        return f"{url}?{urlencode(sorted(params))}"
     
     def _jsonstat_to_dataframe(self, json_data: Dict[str, Any]) -> pd.DataFrame:
         """
@@ -205,17 +312,15 @@ class StatisticsAPI:
             
             # Create index arrays for each dimension
             dimension_indices = []
-            dimension_labels = []
-            
+
             for i, dim_id in enumerate(dimension_ids):
                 dim_size = dimension_sizes[i]
                 dim_info = dimensions.get(dim_id, {})
-                
+
                 # Get category information
                 category = dim_info.get('category', {})
                 index_map = category.get('index', {})
-                label_map = category.get('label', {})
-                
+
                 # Create ordered list of codes
                 if index_map:
                     # Sort by index values to get correct order
@@ -224,77 +329,85 @@ class StatisticsAPI:
                 else:
                     # Fallback to numeric indices
                     codes = [str(j) for j in range(dim_size)]
-                
-                # Get labels for these codes
-                labels = [label_map.get(code, code) for code in codes]
-                
+
                 dimension_indices.append(codes)
-                dimension_labels.append(labels)
+
+            # Create array for values
+            total_size = int(np.prod(dimension_sizes))
+            value_array = np.full(total_size, np.nan, dtype=np.float64)
+
+            # Fill in the values with one bulk fancy-indexed assignment
+            # instead of a Python-level loop over every cell
+            if isinstance(values, dict):
+                if values:
+                    keys_arr = np.fromiter(values.keys(), dtype=np.int64, count=len(values))
+                    vals_arr = np.fromiter(
+                        (np.nan if v is None else v for v in values.values()),
+                        dtype=np.float64, count=len(values)
+                    )
+                    in_range = keys_arr < total_size
+                    value_array[keys_arr[in_range]] = vals_arr[in_range]
+            else:
+                # JSON-stat also allows the dense list form
+                n = min(len(values), total_size)
+                value_array[:n] = np.asarray(values[:n], dtype=np.float64)
             
-            # Create MultiIndex from cartesian product of all dimensions
-            if len(dimension_indices) > 1:
-                index_tuples = list(itertools.product(*dimension_indices))
-                label_tuples = list(itertools.product(*dimension_labels))
-                
-                # Create MultiIndex
-                index = pd.MultiIndex.from_tuples(
-                    index_tuples,
-                    names=dimension_ids
+            # Build the dimension columns directly from the known cartesian
+            # layout (row-major, last dimension fastest) with repeat/tile in
+            # C — no MultiIndex construction and no reset_index copy. Each
+            # column is dictionary-encoded as a Categorical: integer position
+            # codes plus the small per-dimension category list, instead of N
+            # repeated Python strings.
+            sizes = np.asarray(dimension_sizes)
+            data = {}
+            position_codes = {}
+            for i, dim_id in enumerate(dimension_ids):
+                outer = int(sizes[:i].prod())
+                inner = int(sizes[i + 1:].prod())
+                positions = np.tile(
+                    np.repeat(np.arange(sizes[i], dtype=np.int32), inner), outer
                 )
-                
-                # Create label MultiIndex for display
-                label_index = pd.MultiIndex.from_tuples(
-                    label_tuples,
-                    names=dimension_ids
+                position_codes[dim_id] = positions
+                data[dim_id] = pd.Categorical.from_codes(
+                    positions, categories=dimension_indices[i]
                 )
-            else:
-                index = pd.Index(dimension_indices[0], name=dimension_ids[0])
-                label_index = pd.Index(dimension_labels[0], name=dimension_ids[0])
-            
-            # Create array for values
-            total_size = np.prod(dimension_sizes)
-            value_array = np.full(total_size, np.nan)
-            
-            # Fill in the values
-            for key, val in values.items():
-                try:
-                    idx = int(key)
-                    if idx < len(value_array):
-                        value_array[idx] = float(val) if val is not None else np.nan
-                except (ValueError, TypeError):
-                    continue
-            
-            # Create DataFrame
-            df = pd.DataFrame({
-                'value': value_array
-            }, index=index)
-            
-            # Add status information if available
+
+            data['value'] = value_array
+
+            # Add status information if available, bulk-assigned like the
+            # values; the handful of distinct flags ('p', 'e', ...) make the
+            # column a natural Categorical
             if 'status' in json_data:
+                statuses = json_data['status']
                 status_array = np.full(total_size, '', dtype=object)
-                for key, status in json_data['status'].items():
-                    try:
-                        idx = int(key)
-                        if idx < len(status_array):
-                            status_array[idx] = status
-                    except (ValueError, TypeError):
-                        continue
-                df['status'] = status_array
-            
-            # Reset index to make dimensions into columns for easier use
-            df = df.reset_index()
-            
-            # Replace dimension codes with labels for better readability
+                if isinstance(statuses, dict):
+                    if statuses:
+                        skeys = np.fromiter(statuses.keys(), dtype=np.int64, count=len(statuses))
+                        svals = np.array(list(statuses.values()), dtype=object)
+                        in_range = skeys < total_size
+                        status_array[skeys[in_range]] = svals[in_range]
+                else:
+                    n = min(len(statuses), total_size)
+                    status_array[:n] = np.asarray(statuses[:n], dtype=object)
+                data['status'] = pd.Categorical(status_array)
+
+            # Add label columns by fancy-indexing the small per-dimension
+            # label array with the position codes — one C-level gather per
+            # column instead of N dict lookups through Series.map
             for i, dim_id in enumerate(dimension_ids):
                 dim_info = dimensions.get(dim_id, {})
                 category = dim_info.get('category', {})
                 label_map = category.get('label', {})
-                
+
                 if label_map:
-                    # Add a column with labels
-                    df[f'{dim_id}_label'] = df[dim_id].map(label_map)
-            
-            return df
+                    labels = np.array(
+                        [label_map.get(code, code) for code in dimension_indices[i]],
+                        dtype=object
+                    )
+                    data[f'{dim_id}_label'] = labels[position_codes[dim_id]]
+
+            # Create DataFrame with dimensions already as columns
+            return pd.DataFrame(data)
             
         except Exception as e:
             raise DataParsingError(f"Failed to convert JSON-stat to DataFrame: {e}")
\ No newline at end of file
@@ -9,7 +9,25 @@ from pathlib import Path
 from typing import Any, Optional, Dict
 from datetime import datetime, timedelta
 import requests
-from .exceptions import CacheError
+from .exceptions import (
+    CacheError,
+    DatasetNotFoundError,
+    EurostatAPIError,
+    InvalidParameterError,
+)
+
+# orjson decodes multi-MB JSON payloads several times faster than the stdlib;
+# it is an optional extra, so fall back to json when it isn't installed
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+def json_loads(data: bytes) -> Any:
+    """Decode a JSON document, using orjson when it is installed."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
 
 class Cache:
     """Simple file-based cache for API responses."""
@@ -24,40 +42,109 @@ class Cache:
         cache_string = url
         if params:
             cache_string += json.dumps(params, sort_keys=True)
-        return hashlib.md5(cache_string.encode()).hexdigest()
+        # blake2b is faster than md5 and keyed only for uniqueness here;
+        # digest_size=16 keeps the familiar 32-char hex filenames
+        return hashlib.blake2b(cache_string.encode(), digest_size=16).hexdigest()
     
-    def get(self, url: str, params: Optional[Dict] = None) -> Optional[Any]:
-        """Get cached response if available and not expired."""
+    def get(self, url: str, params: Optional[Dict] = None, allow_expired: bool = False,
+            expire_hours: Optional[float] = None) -> Optional[Any]:
+        """
+        Get cached response if available and not expired.
+
+        Args:
+            url: The URL the data was cached under
+            params: Parameters the data was cached with
+            allow_expired: Return the payload even when expired (used for
+                conditional revalidation against the server)
+            expire_hours: Per-entry expiry window overriding the cache-wide
+                default; float('inf') means the entry never expires
+        """
         try:
             cache_key = self._get_cache_key(url, params)
             cache_file = self.cache_dir / f"{cache_key}.pkl"
-            
+
             if not cache_file.exists():
                 return None
-            
+
             # Check if cache has expired
-            file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if file_age > timedelta(hours=self.expire_hours):
+            if not allow_expired and self._is_file_expired(cache_file, expire_hours):
                 cache_file.unlink()  # Remove expired cache
                 return None
-            
+
             with open(cache_file, 'rb') as f:
                 return pickle.load(f)
-                
+
         except Exception as e:
             raise CacheError(f"Error reading from cache: {e}")
-    
-    def set(self, url: str, data: Any, params: Optional[Dict] = None) -> None:
-        """Cache a response."""
+
+    def _is_file_expired(self, cache_file: Path, expire_hours: Optional[float] = None) -> bool:
+        """Check a cache file's age against its expiry window."""
+        hours = self.expire_hours if expire_hours is None else expire_hours
+        if hours == float('inf'):
+            return False
+        file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
+        return file_age > timedelta(hours=hours)
+
+    def set(self, url: str, data: Any, params: Optional[Dict] = None,
+            validators: Optional[Dict[str, str]] = None) -> None:
+        """
+        Cache a response, optionally with its HTTP validators
+        (ETag / Last-Modified) for later conditional requests.
+        """
         try:
             cache_key = self._get_cache_key(url, params)
             cache_file = self.cache_dir / f"{cache_key}.pkl"
-            
+
+            # Highest protocol: markedly faster dump/load for the multi-MB
+            # metabase table than the backward-compatible default
             with open(cache_file, 'wb') as f:
-                pickle.dump(data, f)
-                
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            if validators:
+                meta_file = self.cache_dir / f"{cache_key}.meta.pkl"
+                with open(meta_file, 'wb') as f:
+                    pickle.dump(validators, f, protocol=pickle.HIGHEST_PROTOCOL)
+
         except Exception as e:
             raise CacheError(f"Error writing to cache: {e}")
+
+    def is_expired(self, url: str, params: Optional[Dict] = None,
+                   expire_hours: Optional[float] = None) -> bool:
+        """
+        Check whether a cache entry is missing or past its expiry window.
+
+        Args:
+            url: The URL the data was cached under
+            params: Parameters the data was cached with
+            expire_hours: Per-entry expiry window overriding the cache-wide
+                default; float('inf') means the entry never expires
+        """
+        try:
+            cache_key = self._get_cache_key(url, params)
+            cache_file = self.cache_dir / f"{cache_key}.pkl"
+
+            if not cache_file.exists():
+                return True
+
+            return self._is_file_expired(cache_file, expire_hours)
+
+        except Exception as e:
+            raise CacheError(f"Error reading from cache: {e}")
+
+    def get_validators(self, url: str, params: Optional[Dict] = None) -> Optional[Dict[str, str]]:
+        """Get stored HTTP validators for a cached entry, if any."""
+        try:
+            cache_key = self._get_cache_key(url, params)
+            meta_file = self.cache_dir / f"{cache_key}.meta.pkl"
+
+            if not meta_file.exists():
+                return None
+
+            with open(meta_file, 'rb') as f:
+                return pickle.load(f)
+
+        except Exception as e:
+            raise CacheError(f"Error reading from cache: {e}")
     
     def clear(self) -> None:
         """Clear all cached files."""
@@ -71,28 +158,35 @@ def parse_datetime(date_string: str) -> Optional[datetime]:
     """Parse various datetime formats used by Eurostat API."""
     if not date_string:
         return None
-    
-    formats = [
-        "%Y-%m-%dT%H:%M:%S%z",  # ISO format with timezone
-        "%Y-%m-%d",             # Date only
-        "%d.%m.%Y",            # European date format
-    ]
-    
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_string, fmt)
-        except ValueError:
-            continue
-    
-    return None
+
+    # The formats are distinguishable by shape, so dispatch on it directly:
+    # the common TOC case ('26.06.2025') then costs a single strptime call
+    # instead of two ValueError round-trips through the other formats
+    if '.' in date_string:
+        fmt = "%d.%m.%Y"            # European date format
+    elif 'T' in date_string:
+        fmt = "%Y-%m-%dT%H:%M:%S%z"  # ISO format with timezone
+    else:
+        fmt = "%Y-%m-%d"            # Date only
+
+    try:
+        return datetime.strptime(date_string, fmt)
+    except ValueError:
+        return None
 
 def handle_api_errors(response: requests.Response) -> None:
     """Handle common API error responses."""
-    from .exceptions import EurostatAPIError, DatasetNotFoundError, InvalidParameterError
-    
     if response.status_code == 200:
         return
-    
+
+    # Only attempt the JSON parse when the body claims to be JSON: HTML
+    # error pages from proxies otherwise pay a doomed decode plus a
+    # JSONDecodeError per call. A missing or unusual header means unknown,
+    # so the parse is still attempted as before.
+    content_type = response.headers.get('Content-Type', '')
+    if isinstance(content_type, str) and content_type and 'json' not in content_type:
+        _fallback_api_error(response)
+
     try:
         error_data = response.json()
         if "error" in error_data:
@@ -120,8 +214,11 @@ def handle_api_errors(response: requests.Response) -> None:
                 raise EurostatAPIError(f"API Error {status}: {message}")
     except (json.JSONDecodeError, KeyError, AttributeError):
         pass
-    
-    # Fallback for non-JSON error responses
+
+    _fallback_api_error(response)
+
+def _fallback_api_error(response: requests.Response) -> None:
+    """Raise the status-code-based error for non-JSON error responses."""
     if response.status_code == 404:
         raise DatasetNotFoundError("Dataset not found")
     elif response.status_code == 400:
@@ -131,8 +228,6 @@ def handle_api_errors(response: requests.Response) -> None:
 
 def validate_geo_level(geo_level: str) -> str:
     """Validate geo level parameter."""
-    from .exceptions import InvalidParameterError
-    
     valid_levels = {"aggregate", "country", "nuts1", "nuts2", "nuts3", "city"}
     if geo_level not in valid_levels:
         raise InvalidParameterError(f"Invalid geo level '{geo_level}'. Must be one of: {valid_levels}")
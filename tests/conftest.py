@@ -4,8 +4,6 @@ import pytest
 import pandas as pd
 from datetime import datetime
 from unittest.mock import Mock, patch
-import tempfile
-import shutil
 
 # Import the package modules
 import sys
@@ -17,7 +15,37 @@ from eustatspy.models import DatasetInfo, TableOfContents
 from eustatspy.utils import Cache
 
 
-@pytest.fixture
+def pytest_configure(config):
+    """Register the markers applied below.
+
+    pytest.ini declares them under [tool:pytest], a section pytest only
+    honours in setup.cfg, so without this the marks raise
+    PytestUnknownMarkWarning on every run.
+    """
+    config.addinivalue_line(
+        "markers",
+        "integration: Integration tests that test multiple components together")
+    config.addinivalue_line(
+        "markers", "slow: Tests that take a long time to run")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Tag tests by lane so CI can split fast and slow runs.
+
+    Everything in test_integration.py gets the integration marker, and
+    the scale-sweep tests there (large payloads, 50k-cell sparse
+    frames) get the slow marker so `pytest -m "not slow"` stays a
+    per-commit-fast lane.
+    """
+    for item in items:
+        if "test_integration" in item.nodeid:
+            item.add_marker(pytest.mark.integration)
+            name = item.name.lower()
+            if "large" in name or "scale" in name:
+                item.add_marker(pytest.mark.slow)
+
+
+@pytest.fixture(scope="session")
 def sample_dataset_info():
     """Sample DatasetInfo object for testing."""
     return DatasetInfo(
@@ -35,7 +63,7 @@ def sample_dataset_info():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_toc():
     """Sample TableOfContents for testing."""
     datasets = [
@@ -71,7 +99,7 @@ def sample_toc():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_jsonstat_response():
     """Sample JSON-stat response for testing."""
     return {
@@ -125,7 +153,9 @@ def sample_jsonstat_response():
     }
 
 
-@pytest.fixture
+# Session-scoped: tests only read this dict (or hand it to an API instance),
+# so one copy can serve the whole run
+@pytest.fixture(scope="session")
 def sample_metabase_data():
     """Sample metabase data for testing."""
     return {
@@ -146,8 +176,8 @@ def sample_metabase_data():
 
 @pytest.fixture
 def mock_requests_get():
-    """Mock requests.get for testing."""
-    with patch('requests.get') as mock_get:
+    """Mock requests.Session.get for testing."""
+    with patch('requests.Session.get') as mock_get:
         yield mock_get
 
 
@@ -161,12 +191,13 @@ def mock_successful_response():
     return mock_response
 
 
+# Unique per test for isolation, but carved out of pytest's session
+# basetemp: no mkdtemp against the system tmpdir and no per-test rmtree
+# teardown — pytest prunes old base temp directories itself
 @pytest.fixture
-def temp_cache_dir():
+def temp_cache_dir(tmp_path_factory):
     """Temporary directory for cache testing."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir)
+    return str(tmp_path_factory.mktemp("cache"))
 
 
 @pytest.fixture
@@ -175,23 +206,49 @@ def cache_instance(temp_cache_dir):
     return Cache(temp_cache_dir, expire_hours=1)
 
 
-@pytest.fixture
-def client_no_cache():
-    """EurostatClient without caching."""
+# The clients are built once per session — __init__ wires up the session,
+# retry adapters and both sub-APIs — and the function-scoped wrappers below
+# reset the mutable caches, which is all the tests can dirty
+@pytest.fixture(scope="session")
+def _session_client_no_cache():
     return est.EurostatClient(cache_enabled=False)
 
 
 @pytest.fixture
-def client_with_cache(temp_cache_dir):
-    """EurostatClient with caching enabled."""
+def client_no_cache(_session_client_no_cache):
+    """EurostatClient without caching."""
+    client = _session_client_no_cache
+    client._toc_cache = None
+    client.catalogue._toc_cache = None
+    client.catalogue._metabase_cache = None
+    client.statistics._json_cache.clear()
+    client.statistics._df_cache.clear()
+    return client
+
+
+@pytest.fixture(scope="session")
+def _session_client_with_cache(tmp_path_factory):
     return est.EurostatClient(
         cache_enabled=True,
-        cache_dir=temp_cache_dir,
+        cache_dir=str(tmp_path_factory.mktemp("client_cache")),
         cache_expire_hours=1
     )
 
 
 @pytest.fixture
+def client_with_cache(_session_client_with_cache):
+    """EurostatClient with caching enabled."""
+    client = _session_client_with_cache
+    client.cache.clear()
+    client._toc_cache = None
+    client.catalogue._toc_cache = None
+    client.catalogue._metabase_cache = None
+    client.statistics._json_cache.clear()
+    client.statistics._df_cache.clear()
+    return client
+
+
+@pytest.fixture(scope="session")
 def sample_toc_txt_response():
     """Sample TOC TXT response for testing."""
     return """"title"	"code"	"type"	"last update of data"	"last table structure change"	"data start"	"data end"	"values"
@@ -200,7 +257,27 @@ def sample_toc_txt_response():
 "    Population statistics"	"demo_pjan"	"dataset"	"15.06.2025"	"10.06.2025"	"1990"	"2024"	15000"""
 
 
-@pytest.fixture 
+@pytest.fixture(scope="session")
+def search_results_df():
+    """Mock search-result DataFrame returned by the catalogue layer."""
+    return pd.DataFrame({
+        'code': ['nama_10_gdp', 'demo_pjan'],
+        'title': ['GDP data', 'Population data'],
+        'type': ['dataset', 'dataset']
+    })
+
+
+@pytest.fixture(scope="session")
+def simple_value_df():
+    """Minimal two-row value DataFrame returned by the statistics layer."""
+    return pd.DataFrame({
+        'geo': ['SE', 'NO'],
+        'time': ['2020', '2020'],
+        'value': [1000.5, 1100.2]
+    })
+
+
+@pytest.fixture(scope="session")
 def sample_geo_response():
     """Sample geographic data response."""
     return {
@@ -2,8 +2,14 @@
 
 import pytest
 import pandas as pd
-import gzip
 import io
+
+# ISA-L's igzip compresses a few times faster than stdlib zlib and is
+# API-compatible for the fixture building below; fall back when absent
+try:
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
 from unittest.mock import patch, Mock
 from datetime import datetime
 from eustatspy.catalogue import CatalogueAPI
@@ -11,24 +17,103 @@ from eustatspy.models import DatasetInfo, TableOfContents
 from eustatspy.exceptions import EurostatAPIError, DataParsingError, InvalidParameterError
 
 
+# Shared negative-path payloads for error-handling tests
+INVALID_GZIP = b"invalid gzip content"
+EMPTY_TOC = ""
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response.
+
+    A slotted class with plain attributes is far cheaper to build and read
+    than a Mock, whose attribute access allocates child mocks on the fly.
+    """
+    __slots__ = ('status_code', 'text', 'content', 'headers', '_json')
+
+    def json(self):
+        return self._json
+
+
 def create_mock_response(data, status_code=200, content_type="application/json"):
     """Create a mock response object."""
-    mock_response = Mock()
+    mock_response = _FakeResponse()
     mock_response.status_code = status_code
-    
+    mock_response.headers = {}
+
     if content_type == "application/json":
-        mock_response.json.return_value = data
+        mock_response._json = data
         mock_response.text = str(data) if not isinstance(data, str) else data
     else:
         mock_response.text = data
         mock_response.content = data.encode() if isinstance(data, str) else data
-    
+
     return mock_response
 
 
+# Session-scoped compressed blobs: the TSV assembly and DEFLATE encode are
+# paid once per pytest run instead of per test, and compresslevel=1 keeps the
+# encode cheap — the tests only need a valid gzip stream, not a small one.
+@pytest.fixture(scope="session")
+def gzipped_metabase_small(sample_metabase_data):
+    """Gzipped TSV form of sample_metabase_data, compressed once per run."""
+    lines = [
+        f"{dataset_code}\t{dimension}\t{value}".encode()
+        for dataset_code, dimensions in sample_metabase_data.items()
+        for dimension, values in dimensions.items()
+        for value in values
+    ]
+    return gzip.compress(b'\n'.join(lines), compresslevel=1)
+
+
+@pytest.fixture(scope="session")
+def gzipped_metabase_large():
+    """Gzipped 1000-dataset metabase TSV, compressed once per run."""
+    # Stream pre-encoded fragments straight into the gzip writer rather
+    # than materializing the full TSV string and re-encoding it
+    buf = io.BytesIO()
+    with gzip.open(buf, 'wb', compresslevel=1) as gz:
+        gz.writelines(
+            f"dataset_{i}\tgeo\tSE\ndataset_{i}\ttime\t2020\n".encode()
+            for i in range(1000)
+        )
+    return buf.getvalue()
+
+
+# One API preloaded with the sample metabase for the read-only dimension and
+# search tests; sharing it also lets the lazy lowercase-code index build once
+@pytest.fixture(scope="session")
+def metabase_api(sample_metabase_data):
+    api = CatalogueAPI()
+    api._metabase_cache = sample_metabase_data
+    return api
+
+
+# Module-wide CatalogueAPI for tests that don't need their own cache: the
+# function-scoped wrapper resets the mutable state, which is far cheaper
+# than re-running __init__ (and its Session construction) per test
+@pytest.fixture(scope="module")
+def _shared_api():
+    return CatalogueAPI()
+
+
+@pytest.fixture
+def api(_shared_api):
+    _shared_api.cache = None
+    _shared_api._metabase_cache = None
+    _shared_api._toc_cache = None
+    return _shared_api
+
+
 class TestCatalogueAPI:
     """Test cases for CatalogueAPI."""
-    
+
+    # One autouse patcher instead of a @patch decorator per method; tests
+    # that need the mock just take the fixture argument
+    @pytest.fixture(autouse=True)
+    def mock_get(self):
+        with patch('requests.Session.get') as m:
+            yield m
+
     def test_initialization(self):
         """Test CatalogueAPI initialization."""
         api = CatalogueAPI()
@@ -41,10 +126,8 @@ class TestCatalogueAPI:
         api = CatalogueAPI(cache=cache_instance)
         assert api.cache == cache_instance
     
-    @patch('requests.get')
-    def test_get_toc_txt_success(self, mock_get, sample_toc_txt_response):
+    def test_get_toc_txt_success(self, mock_get, sample_toc_txt_response, api):
         """Test successful retrieval of table of contents in TXT format."""
-        api = CatalogueAPI()
         mock_response = create_mock_response(sample_toc_txt_response, content_type="text/plain")
         mock_get.return_value = mock_response
         
@@ -52,8 +135,9 @@ class TestCatalogueAPI:
         
         assert isinstance(toc, TableOfContents)
         assert len(toc.datasets) >= 2  # At least folder and datasets
-        assert 'data' in [d.code for d in toc.datasets]
-        assert 'nama_10_gdp' in [d.code for d in toc.datasets]
+        codes = {d.code for d in toc.datasets}
+        assert 'data' in codes
+        assert 'nama_10_gdp' in codes
         
         # Check hierarchy
         assert 'data' in toc.hierarchy
@@ -63,7 +147,20 @@ class TestCatalogueAPI:
         assert 'toc/txt' in call_args[0][0]
         assert call_args[1]['params']['lang'] == 'en'
     
-    @patch('requests.get')
+    def test_get_table_of_contents_memoized(self, mock_get, sample_toc_txt_response, api):
+        """Test that the parsed TOC is memoized in memory."""
+        mock_response = create_mock_response(sample_toc_txt_response, content_type="text/plain")
+        mock_get.return_value = mock_response
+
+        toc1 = api.get_table_of_contents()
+        toc2 = api.get_table_of_contents()
+        assert toc2 is toc1
+        assert mock_get.call_count == 1  # Second call served from memory
+
+        # refresh=True bypasses the in-memory copy
+        api.get_table_of_contents(refresh=True)
+        assert mock_get.call_count == 2
+
     def test_get_toc_txt_with_cache(self, mock_get, cache_instance, sample_toc_txt_response):
         """Test TOC retrieval with caching."""
         api = CatalogueAPI(cache=cache_instance)
@@ -79,50 +176,41 @@ class TestCatalogueAPI:
         assert mock_get.call_count == 1  # Still 1, used cache
         assert toc1.datasets[0].code == toc2.datasets[0].code
     
-    @patch('requests.get')
-    def test_get_metabase_success(self, mock_get, sample_metabase_data):
-        """Test successful metabase retrieval."""
-        api = CatalogueAPI()
-        
-        # Create gzipped metabase content
-        metabase_lines = []
-        for dataset_code, dimensions in sample_metabase_data.items():
-            for dimension, values in dimensions.items():
-                for value in values:
-                    metabase_lines.append(f"{dataset_code}\t{dimension}\t{value}")
-        
-        metabase_content = '\n'.join(metabase_lines)
-        gzipped_content = gzip.compress(metabase_content.encode('utf-8'))
-        
+    # One data-driven body covers the small and 1000-dataset payloads;
+    # both reuse the session-scoped compressed blobs
+    @pytest.mark.parametrize("blob_fixture,expected_len,spot_dataset,spot_value", [
+        ("gzipped_metabase_small", 2, "nama_10_gdp", "EU27_2020"),
+        ("gzipped_metabase_large", 1000, "dataset_999", "SE"),
+    ])
+    def test_get_metabase_success(self, request, mock_get, blob_fixture,
+                                  expected_len, spot_dataset, spot_value, api):
+        """Test successful metabase retrieval for small and large payloads."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = gzipped_content
+        mock_response.headers = {}
+        mock_response.raw = io.BytesIO(request.getfixturevalue(blob_fixture))
         mock_get.return_value = mock_response
-        
+
         metabase = api.get_metabase()
-        
+
         assert isinstance(metabase, dict)
-        assert 'nama_10_gdp' in metabase
-        assert 'demo_pjan' in metabase
-        assert 'geo' in metabase['nama_10_gdp']
-        assert 'EU27_2020' in metabase['nama_10_gdp']['geo']
-        
+        assert len(metabase) == expected_len
+        assert spot_dataset in metabase
+        assert 'geo' in metabase[spot_dataset]
+        assert spot_value in metabase[spot_dataset]['geo']
+
         mock_get.assert_called_once()
         call_args = mock_get.call_args
         assert 'metabase.txt.gz' in call_args[0][0]
     
-    @patch('requests.get')
-    def test_get_metabase_with_cache(self, mock_get, cache_instance, sample_metabase_data):
+    def test_get_metabase_with_cache(self, mock_get, cache_instance, gzipped_metabase_small):
         """Test metabase retrieval with caching."""
         api = CatalogueAPI(cache=cache_instance)
-        
-        # Setup mock response
-        metabase_content = "nama_10_gdp\tgeo\tSE\nnama_10_gdp\ttime\t2020"
-        gzipped_content = gzip.compress(metabase_content.encode('utf-8'))
-        
+
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = gzipped_content
+        mock_response.headers = {}
+        mock_response.raw = io.BytesIO(gzipped_metabase_small)
         mock_get.return_value = mock_response
         
         # First call
@@ -134,10 +222,47 @@ class TestCatalogueAPI:
         assert mock_get.call_count == 1  # Still 1, used cache
         assert metabase1 == metabase2
     
-    def test_get_metabase_refresh(self, sample_metabase_data):
+    def test_get_metabase_conditional_revalidation(self, mock_get, cache_instance):
+        """Test that an expired cache entry is revalidated with a 304."""
+        import os
+        # Finite expiry for the metabase slot so the aged entry counts as stale
+        api = CatalogueAPI(cache=cache_instance, metabase_expire_hours=1)
+
+        metabase_content = "nama_10_gdp\tgeo\tSE\nnama_10_gdp\ttime\t2020"
+        gzipped_content = gzip.compress(metabase_content.encode('utf-8'))
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'ETag': '"abc123"'}
+        mock_response.raw = io.BytesIO(gzipped_content)
+        mock_get.return_value = mock_response
+
+        # First call downloads and stores the validator
+        metabase1 = api.get_metabase()
+
+        # Expire the cached payload
+        url = f"{api.base_url}/catalogue/metabase.txt.gz"
+        cache_key = cache_instance._get_cache_key(url)
+        cache_file = cache_instance.cache_dir / f"{cache_key}.pkl"
+        old_time = datetime.now().timestamp() - 7200
+        os.utime(cache_file, (old_time, old_time))
+
+        # Server says unchanged; the stale entry should be reused
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        mock_get.return_value = not_modified
+
+        api._metabase_cache = None
+        metabase2 = api.get_metabase()
+
+        assert metabase2 == metabase1
+        assert mock_get.call_count == 2
+        sent_headers = mock_get.call_args[1]['headers']
+        assert sent_headers['If-None-Match'] == '"abc123"'
+
+    def test_get_metabase_refresh(self, sample_metabase_data, api):
         """Test metabase refresh functionality."""
-        api = CatalogueAPI()
-        
         # Set initial metabase cache
         api._metabase_cache = {"old": "data"}
         
@@ -150,60 +275,46 @@ class TestCatalogueAPI:
             # The cache should be cleared (set to None) before calling
             assert result == sample_metabase_data
     
-    def test_get_dataset_dimensions_from_metabase(self, sample_metabase_data):
+    def test_get_dataset_dimensions_from_metabase(self, metabase_api, sample_metabase_data):
         """Test getting dataset dimensions from metabase."""
-        api = CatalogueAPI()
-        api._metabase_cache = sample_metabase_data
-        
-        dimensions = api.get_dataset_dimensions_from_metabase('nama_10_gdp')
-        
+        dimensions = metabase_api.get_dataset_dimensions_from_metabase('nama_10_gdp')
+
         assert dimensions == sample_metabase_data['nama_10_gdp']
         assert 'geo' in dimensions
         assert 'time' in dimensions
         assert 'EU27_2020' in dimensions['geo']
     
-    def test_get_dataset_dimensions_nonexistent(self, sample_metabase_data):
+    def test_get_dataset_dimensions_nonexistent(self, metabase_api):
         """Test getting dimensions for non-existent dataset."""
-        api = CatalogueAPI()
-        api._metabase_cache = sample_metabase_data
-        
-        dimensions = api.get_dataset_dimensions_from_metabase('nonexistent')
-        
+        dimensions = metabase_api.get_dataset_dimensions_from_metabase('nonexistent')
+
         assert dimensions == {}
-    
-    def test_get_all_dataset_codes(self, sample_metabase_data):
+
+    def test_get_all_dataset_codes(self, metabase_api):
         """Test getting all dataset codes."""
-        api = CatalogueAPI()
-        api._metabase_cache = sample_metabase_data
-        
-        codes = api.get_all_dataset_codes()
-        
+        codes = metabase_api.get_all_dataset_codes()
+
         assert isinstance(codes, list)
         assert 'nama_10_gdp' in codes
         assert 'demo_pjan' in codes
         assert len(codes) == 2
-    
-    def test_search_datasets_in_metabase(self, sample_metabase_data):
+
+    def test_search_datasets_in_metabase(self, metabase_api):
         """Test searching datasets in metabase."""
-        api = CatalogueAPI()
-        api._metabase_cache = sample_metabase_data
-        
         # Search for GDP
-        results = api.search_datasets_in_metabase('gdp')
+        results = metabase_api.search_datasets_in_metabase('gdp')
         assert 'nama_10_gdp' in results
-        
+
         # Search for demo
-        results = api.search_datasets_in_metabase('demo')
+        results = metabase_api.search_datasets_in_metabase('demo')
         assert 'demo_pjan' in results
-        
+
         # Search case insensitive
-        results = api.search_datasets_in_metabase('GDP')
+        results = metabase_api.search_datasets_in_metabase('GDP')
         assert 'nama_10_gdp' in results
     
-    def test_search_datasets_success(self, sample_toc):
+    def test_search_datasets_success(self, sample_toc, api):
         """Test successful dataset searching."""
-        api = CatalogueAPI()
-        
         with patch.object(api, 'get_table_of_contents', return_value=sample_toc):
             results = api.search_datasets('GDP')
         
@@ -213,10 +324,8 @@ class TestCatalogueAPI:
         assert 'title' in results.columns
         assert 'nama_10_gdp' in results['code'].values
     
-    def test_search_datasets_with_date_filter(self, sample_toc):
+    def test_search_datasets_with_date_filter(self, sample_toc, api):
         """Test dataset searching with date filter."""
-        api = CatalogueAPI()
-        
         with patch.object(api, 'get_table_of_contents', return_value=sample_toc):
             # Search with valid date filter
             results = api.search_datasets('GDP', updated_since='2025-06-01')
@@ -226,26 +335,20 @@ class TestCatalogueAPI:
             results = api.search_datasets('GDP', updated_since='2025-12-31')
             assert len(results) == 0
     
-    def test_search_datasets_invalid_date(self, sample_toc):
+    def test_search_datasets_invalid_date(self, sample_toc, api):
         """Test dataset searching with invalid date format."""
-        api = CatalogueAPI()
-        
         with patch.object(api, 'get_table_of_contents', return_value=sample_toc):
             with pytest.raises(InvalidParameterError, match="Invalid date format"):
                 api.search_datasets('GDP', updated_since='invalid-date')
     
-    def test_search_datasets_max_results(self, sample_toc):
+    def test_search_datasets_max_results(self, sample_toc, api):
         """Test dataset searching with max results limit."""
-        api = CatalogueAPI()
-        
         with patch.object(api, 'get_table_of_contents', return_value=sample_toc):
             results = api.search_datasets('', max_results=1)  # Search all, limit to 1
             assert len(results) <= 1
     
-    def test_get_dataset_info_found(self, sample_toc):
+    def test_get_dataset_info_found(self, sample_toc, api):
         """Test getting info for existing dataset."""
-        api = CatalogueAPI()
-        
         with patch.object(api, 'get_table_of_contents', return_value=sample_toc):
             info = api.get_dataset_info('nama_10_gdp')
         
@@ -253,19 +356,15 @@ class TestCatalogueAPI:
         assert info.code == 'nama_10_gdp'
         assert info.title == 'GDP and main components'
     
-    def test_get_dataset_info_not_found(self, sample_toc):
+    def test_get_dataset_info_not_found(self, sample_toc, api):
         """Test getting info for non-existent dataset."""
-        api = CatalogueAPI()
-        
         with patch.object(api, 'get_table_of_contents', return_value=sample_toc):
             info = api.get_dataset_info('nonexistent')
         
         assert info is None
     
-    @patch('requests.get')
-    def test_get_table_of_contents_calls_txt(self, mock_get, sample_toc_txt_response):
+    def test_get_table_of_contents_calls_txt(self, mock_get, sample_toc_txt_response, api):
         """Test that get_table_of_contents calls the TXT endpoint."""
-        api = CatalogueAPI()
         mock_response = create_mock_response(sample_toc_txt_response, content_type="text/plain")
         mock_get.return_value = mock_response
         
@@ -275,50 +374,63 @@ class TestCatalogueAPI:
         mock_get.assert_called_once()
 
 
+# Shared parser instance for the parsing tests below: _get_toc_txt keeps no
+# state on the API (and cache is None), so one object serves the module
+@pytest.fixture(scope="module")
+def toc_parser_api():
+    return CatalogueAPI()
+
+
+# Parsed once per module: the three assertion-only indentation checks all
+# read the same TableOfContents without re-running the line parser
+@pytest.fixture(scope="module")
+def parsed_indented_toc(toc_parser_api):
+    toc_content = """"title"	"code"	"type"	"last update of data"	"last table structure change"	"data start"	"data end"	"values"
+"Database by themes"	"data"	"folder"	" "	" "	" "	" "
+"    General statistics"	"general"	"folder"	" "	" "	" "	" "
+"        GDP statistics"	"nama_10_gdp"	"dataset"	"26.06.2025"	"14.04.2025"	"1975"	"2024"	1049888
+"        Population"	"demo_pjan"	"dataset"	"15.06.2025"	"10.06.2025"	"1990"	"2024"	15000"""
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value = create_mock_response(toc_content, content_type="text/plain")
+        return toc_parser_api._get_toc_txt()
+
+
 class TestCatalogueAPITOCParsing:
     """Test TOC parsing functionality."""
-    
-    def test_toc_parsing_with_indentation(self):
+
+    @pytest.fixture(autouse=True)
+    def mock_get(self):
+        with patch('requests.Session.get') as m:
+            yield m
+
+    def test_toc_parsing_with_indentation(self, parsed_indented_toc):
         """Test TOC parsing with proper indentation handling."""
-        api = CatalogueAPI()
-        
-        toc_content = """"title"	"code"	"type"	"last update of data"	"last table structure change"	"data start"	"data end"	"values"
-"Database by themes"	"data"	"folder"	" "	" "	" "	" "	
-"    General statistics"	"general"	"folder"	" "	" "	" "	" "	
-"        GDP statistics"	"nama_10_gdp"	"dataset"	"26.06.2025"	"14.04.2025"	"1975"	"2024"	1049888
-"        Population"	"demo_pjan"	"dataset"	"15.06.2025"	"10.06.2025"	"1990"	"2024"	15000"""
-        
-        with patch('requests.get') as mock_get:
-            mock_response = create_mock_response(toc_content, content_type="text/plain")
-            mock_get.return_value = mock_response
-            
-            toc = api._get_toc_txt()
-        
+        toc = parsed_indented_toc
+
         # Check datasets
-        dataset_codes = [d.code for d in toc.datasets]
+        dataset_codes = {d.code for d in toc.datasets}
         assert 'data' in dataset_codes
         assert 'general' in dataset_codes
         assert 'nama_10_gdp' in dataset_codes
         assert 'demo_pjan' in dataset_codes
-        
+
         # Check hierarchy
-        assert 'data' in toc.hierarchy
-        assert 'general' in toc.hierarchy['data']
-        assert 'nama_10_gdp' in toc.hierarchy['general']
-        assert 'demo_pjan' in toc.hierarchy['general']
+        hierarchy = toc.hierarchy
+        assert 'data' in hierarchy
+        assert 'general' in hierarchy['data']
+        general_children = hierarchy['general']
+        assert 'nama_10_gdp' in general_children
+        assert 'demo_pjan' in general_children
     
-    def test_toc_parsing_date_formats(self):
+    def test_toc_parsing_date_formats(self, mock_get, toc_parser_api):
         """Test parsing of different date formats in TOC."""
-        api = CatalogueAPI()
-        
         toc_content = """"title"	"code"	"type"	"last update of data"	"last table structure change"	"data start"	"data end"	"values"
 "Test Dataset"	"test_data"	"dataset"	"26.06.2025"	"14.04.2025"	"1975"	"2024"	1000"""
-        
-        with patch('requests.get') as mock_get:
-            mock_response = create_mock_response(toc_content, content_type="text/plain")
-            mock_get.return_value = mock_response
-            
-            toc = api._get_toc_txt()
+
+        mock_get.return_value = create_mock_response(toc_content, content_type="text/plain")
+
+        toc = toc_parser_api._get_toc_txt()
         
         # Find the test dataset
         test_dataset = next(d for d in toc.datasets if d.code == 'test_data')
@@ -329,18 +441,14 @@ class TestCatalogueAPITOCParsing:
         assert test_dataset.data_end == "2024"
         assert test_dataset.values_count == 1000
     
-    def test_toc_parsing_empty_values(self):
+    def test_toc_parsing_empty_values(self, mock_get, toc_parser_api):
         """Test parsing of empty/missing values in TOC."""
-        api = CatalogueAPI()
-        
         toc_content = """"title"	"code"	"type"	"last update of data"	"last table structure change"	"data start"	"data end"	"values"
 "Test Folder"	"test_folder"	"folder"	" "	" "	" "	" "	"""
-        
-        with patch('requests.get') as mock_get:
-            mock_response = create_mock_response(toc_content, content_type="text/plain")
-            mock_get.return_value = mock_response
-            
-            toc = api._get_toc_txt()
+
+        mock_get.return_value = create_mock_response(toc_content, content_type="text/plain")
+
+        toc = toc_parser_api._get_toc_txt()
         
         # Find the test folder
         test_folder = next(d for d in toc.datasets if d.code == 'test_folder')
@@ -354,12 +462,14 @@ class TestCatalogueAPITOCParsing:
 
 class TestCatalogueAPIErrorHandling:
     """Test error handling in CatalogueAPI."""
-    
-    @patch('requests.get')
-    def test_toc_http_error(self, mock_get):
+
+    @pytest.fixture(autouse=True)
+    def mock_get(self):
+        with patch('requests.Session.get') as m:
+            yield m
+
+    def test_toc_http_error(self, mock_get, api):
         """Test handling of HTTP errors when getting TOC."""
-        api = CatalogueAPI()
-        
         mock_response = Mock()
         mock_response.status_code = 404
         mock_response.json.return_value = {"error": {"status": 404, "label": "Not found"}}
@@ -368,11 +478,8 @@ class TestCatalogueAPIErrorHandling:
         with pytest.raises(EurostatAPIError):
             api._get_toc_txt()
     
-    @patch('requests.get')
-    def test_metabase_http_error(self, mock_get):
+    def test_metabase_http_error(self, mock_get, api):
         """Test handling of HTTP errors when getting metabase."""
-        api = CatalogueAPI()
-        
         mock_response = Mock()
         mock_response.status_code = 500
         mock_get.return_value = mock_response
@@ -380,11 +487,8 @@ class TestCatalogueAPIErrorHandling:
         with pytest.raises(EurostatAPIError):
             api.get_metabase()
     
-    @patch('requests.get')
-    def test_toc_malformed_csv(self, mock_get):
+    def test_toc_malformed_csv(self, mock_get, api):
         """Test handling of malformed CSV in TOC response."""
-        api = CatalogueAPI()
-        
         malformed_content = "malformed,csv\nwith,wrong,number,of,columns"
         mock_response = create_mock_response(malformed_content, content_type="text/plain")
         mock_get.return_value = mock_response
@@ -393,26 +497,21 @@ class TestCatalogueAPIErrorHandling:
         toc = api._get_toc_txt()
         assert isinstance(toc, TableOfContents)
     
-    @patch('requests.get')
-    def test_toc_empty_response(self, mock_get):
+    def test_toc_empty_response(self, mock_get, api):
         """Test handling of empty TOC response."""
-        api = CatalogueAPI()
-        
-        mock_response = create_mock_response("", content_type="text/plain")
+        mock_response = create_mock_response(EMPTY_TOC, content_type="text/plain")
         mock_get.return_value = mock_response
         
         with pytest.raises(EurostatAPIError, match="Failed to get table of contents"):
             api._get_toc_txt()
     
-    @patch('requests.get')
-    def test_metabase_gzip_error(self, mock_get):
+    def test_metabase_gzip_error(self, mock_get, api):
         """Test handling of gzip decompression errors."""
-        api = CatalogueAPI()
-        
         # Invalid gzip content
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = b"invalid gzip content"
+        mock_response.headers = {}
+        mock_response.raw = io.BytesIO(INVALID_GZIP)
         mock_get.return_value = mock_response
         
         with pytest.raises(EurostatAPIError, match="Failed to get metabase"):
@@ -422,47 +521,19 @@ class TestCatalogueAPIErrorHandling:
 class TestCatalogueAPIEdgeCases:
     """Test edge cases for CatalogueAPI."""
     
-    def test_search_datasets_empty_query(self, sample_toc):
+    def test_search_datasets_empty_query(self, sample_toc, api):
         """Test searching with empty query string."""
-        api = CatalogueAPI()
-        
         with patch.object(api, 'get_table_of_contents', return_value=sample_toc):
             results = api.search_datasets('')
         
         # Empty query should return all datasets
         assert len(results) >= 2  # Should find all datasets
     
-    def test_search_datasets_no_matches(self, sample_toc):
+    def test_search_datasets_no_matches(self, sample_toc, api):
         """Test searching with query that has no matches."""
-        api = CatalogueAPI()
-        
         with patch.object(api, 'get_table_of_contents', return_value=sample_toc):
             results = api.search_datasets('nonexistent_term_xyz')
         
         assert len(results) == 0
         assert isinstance(results, pd.DataFrame)
     
-    def test_metabase_large_dataset(self):
-        """Test handling of large metabase data."""
-        api = CatalogueAPI()
-        
-        # Create large metabase content
-        large_metabase_lines = []
-        for i in range(1000):
-            large_metabase_lines.append(f"dataset_{i}\tgeo\tSE")
-            large_metabase_lines.append(f"dataset_{i}\ttime\t2020")
-        
-        metabase_content = '\n'.join(large_metabase_lines)
-        gzipped_content = gzip.compress(metabase_content.encode('utf-8'))
-        
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.content = gzipped_content
-            mock_get.return_value = mock_response
-            
-            metabase = api.get_metabase()
-        
-        assert len(metabase) == 1000
-        assert 'dataset_0' in metabase
-        assert 'dataset_999' in metabase
\ No newline at end of file
@@ -1,11 +1,58 @@
 """Tests for the main EurostatClient class."""
 
 import pytest
+import numpy as np
 import pandas as pd
-from unittest.mock import patch, Mock
+from itertools import product
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch, Mock
 import eustatspy as est
 from eustatspy.exceptions import EurostatAPIError, DatasetNotFoundError
 
+COUNTRY_LABELS = {'SE': 'Sweden', 'NO': 'Norway', 'DK': 'Denmark'}
+
+
+# Built once per module: an 18-row (3 geo × 3 time × 2 unit) frame assembled
+# column-wise rather than through per-row dict appends
+@pytest.fixture(scope="module")
+def realistic_gdp_df():
+    combos = list(product(['SE', 'NO', 'DK'],
+                          ['2020', '2021', '2022'],
+                          ['CP_MEUR', 'CLV20_MEUR']))
+    geos, times, units = map(list, zip(*combos))
+    return pd.DataFrame({
+        'geo': geos,
+        'geo_label': [COUNTRY_LABELS[g] for g in geos],
+        'time': times,
+        'unit': units,
+        'value': np.arange(1000, 1000 + len(combos)),
+    })
+
+
+# One patcher per module instead of one @patch decorator per test: the
+# sub-API entry points are swapped for MagicMocks once, and the
+# function-scoped view below wipes their state between tests
+@pytest.fixture(scope="module")
+def _api_method_patches():
+    with patch.multiple('eustatspy.catalogue.CatalogueAPI',
+                        get_table_of_contents=DEFAULT,
+                        search_datasets=DEFAULT,
+                        get_dataset_info=DEFAULT,
+                        get_dataset_dimensions_from_metabase=DEFAULT,
+                        get_metabase=DEFAULT) as catalogue_mocks, \
+         patch.multiple('eustatspy.statistics.StatisticsAPI',
+                        get_data=DEFAULT,
+                        get_data_as_dataframe=DEFAULT) as statistics_mocks:
+        yield {**catalogue_mocks, **statistics_mocks}
+
+
+@pytest.fixture
+def api_mocks(_api_method_patches):
+    """Per-test view of the shared sub-API mocks, reset between tests."""
+    for mock in _api_method_patches.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return SimpleNamespace(**_api_method_patches)
+
 
 class TestEurostatClient:
     """Test cases for EurostatClient."""
@@ -41,9 +88,31 @@ class TestEurostatClient:
         assert client.catalogue.base_url == custom_url
         assert client.statistics.base_url == custom_url
     
-    @patch('eustatspy.catalogue.CatalogueAPI.get_table_of_contents')
-    def test_get_table_of_contents(self, mock_get_toc, client_no_cache, sample_toc):
+    def test_client_shared_session(self):
+        """Test that both API handlers share the client's pooled session."""
+        client = est.EurostatClient()
+        assert client.catalogue.session is client._session
+        assert client.statistics.session is client._session
+        assert 'gzip' in client._session.headers['Accept-Encoding']
+
+    def test_client_retry_policy(self):
+        """Test that the session adapter carries the retry policy."""
+        client = est.EurostatClient(max_retries=5, retry_backoff=1.0)
+        adapter = client._session.get_adapter("https://ec.europa.eu")
+        assert adapter.max_retries.total == 5
+        assert adapter.max_retries.backoff_factor == 1.0
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_client_context_manager(self):
+        """Test that the client closes its session on context exit."""
+        with est.EurostatClient() as client:
+            assert client.catalogue.session is client._session
+        # Closing again is a no-op
+        client.close()
+
+    def test_get_table_of_contents(self, api_mocks, client_no_cache, sample_toc):
         """Test getting table of contents."""
+        mock_get_toc = api_mocks.get_table_of_contents
         mock_get_toc.return_value = sample_toc
         
         # First call
@@ -61,16 +130,10 @@ class TestEurostatClient:
         assert toc3 == sample_toc
         assert mock_get_toc.call_count == 2  # Called again
     
-    @patch('eustatspy.catalogue.CatalogueAPI.search_datasets')
-    def test_search_datasets(self, mock_search, client_no_cache):
+    def test_search_datasets(self, api_mocks, client_no_cache, search_results_df):
         """Test dataset searching."""
-        # Create mock search results
-        mock_df = pd.DataFrame({
-            'code': ['nama_10_gdp', 'demo_pjan'],
-            'title': ['GDP data', 'Population data'],
-            'type': ['dataset', 'dataset']
-        })
-        mock_search.return_value = mock_df
+        mock_search = api_mocks.search_datasets
+        mock_search.return_value = search_results_df
         
         # Test basic search
         results = client_no_cache.search_datasets("GDP")
@@ -82,9 +145,9 @@ class TestEurostatClient:
         client_no_cache.search_datasets("population", max_results=10, updated_since="2025-01-01")
         mock_search.assert_called_with("population", 10, "2025-01-01")
     
-    @patch('eustatspy.catalogue.CatalogueAPI.get_dataset_info')
-    def test_get_dataset_info(self, mock_get_info, client_no_cache, sample_dataset_info):
+    def test_get_dataset_info(self, api_mocks, client_no_cache, sample_dataset_info):
         """Test getting dataset information."""
+        mock_get_info = api_mocks.get_dataset_info
         mock_get_info.return_value = sample_dataset_info
         
         info = client_no_cache.get_dataset_info("nama_10_gdp")
@@ -96,16 +159,10 @@ class TestEurostatClient:
         info = client_no_cache.get_dataset_info("nonexistent")
         assert info is None
     
-    @patch('eustatspy.statistics.StatisticsAPI.get_data_as_dataframe')
-    def test_get_data_as_dataframe(self, mock_get_data, client_no_cache):
+    def test_get_data_as_dataframe(self, api_mocks, client_no_cache, simple_value_df):
         """Test getting data as DataFrame."""
-        # Create mock DataFrame
-        mock_df = pd.DataFrame({
-            'geo': ['SE', 'NO'],
-            'time': ['2020', '2020'],
-            'value': [1000.5, 1100.2]
-        })
-        mock_get_data.return_value = mock_df
+        mock_get_data = api_mocks.get_data_as_dataframe
+        mock_get_data.return_value = simple_value_df
         
         # Test basic call
         df = client_no_cache.get_data_as_dataframe('nama_10_gdp', geo='SE')
@@ -127,18 +184,49 @@ class TestEurostatClient:
             unit='CP_MEUR'
         )
     
-    @patch('eustatspy.statistics.StatisticsAPI.get_data')
-    def test_get_raw_data(self, mock_get_data, client_no_cache, sample_jsonstat_response):
+    def test_get_many_as_dataframes(self, api_mocks, client_no_cache, simple_value_df):
+        """Test concurrent retrieval of multiple datasets."""
+        mock_get_data = api_mocks.get_data_as_dataframe
+        mock_get_data.return_value = simple_value_df
+
+        dfs = client_no_cache.get_many_as_dataframes(
+            ['nama_10_gdp', 'demo_pjan'], geo='SE'
+        )
+
+        # Results keyed by code, in input order
+        assert list(dfs.keys()) == ['nama_10_gdp', 'demo_pjan']
+        assert len(dfs['nama_10_gdp']) == 2
+        assert mock_get_data.call_count == 2
+        mock_get_data.assert_any_call('nama_10_gdp', geo='SE')
+        mock_get_data.assert_any_call('demo_pjan', geo='SE')
+
+        # Empty input short-circuits without any requests
+        mock_get_data.reset_mock()
+        assert client_no_cache.get_many_as_dataframes([]) == {}
+        mock_get_data.assert_not_called()
+
+    def test_get_data_as_dataframes_batch(self, api_mocks, client_no_cache):
+        """Test the batch alias delegates to the concurrent fetch."""
+        mock_get_data = api_mocks.get_data_as_dataframe
+        mock_get_data.return_value = pd.DataFrame({'value': [1.0]})
+
+        dfs = client_no_cache.get_data_as_dataframes(['nama_10_gdp', 'demo_pjan'])
+
+        assert list(dfs.keys()) == ['nama_10_gdp', 'demo_pjan']
+        assert mock_get_data.call_count == 2
+
+    def test_get_raw_data(self, api_mocks, client_no_cache, sample_jsonstat_response):
         """Test getting raw JSON-stat data."""
+        mock_get_data = api_mocks.get_data
         mock_get_data.return_value = sample_jsonstat_response
         
         data = client_no_cache.get_raw_data('nama_10_gdp', geo='SE')
         assert data == sample_jsonstat_response
         mock_get_data.assert_called_once_with('nama_10_gdp', geo='SE')
     
-    @patch('eustatspy.catalogue.CatalogueAPI.get_dataset_dimensions_from_metabase')
-    def test_get_available_filters(self, mock_get_dimensions, client_no_cache, sample_metabase_data):
+    def test_get_available_filters(self, api_mocks, client_no_cache, sample_metabase_data):
         """Test getting available filters."""
+        mock_get_dimensions = api_mocks.get_dataset_dimensions_from_metabase
         mock_get_dimensions.return_value = sample_metabase_data['nama_10_gdp']
         
         filters = client_no_cache.get_available_filters('nama_10_gdp')
@@ -167,9 +255,9 @@ class TestEurostatClient:
         assert name == "Sweden"
         mock_get_label.assert_called_once_with('SE')
     
-    @patch('eustatspy.catalogue.CatalogueAPI.get_metabase')
-    def test_preload_metabase(self, mock_get_metabase, client_no_cache, sample_metabase_data):
+    def test_preload_metabase(self, api_mocks, client_no_cache, sample_metabase_data):
         """Test preloading metabase."""
+        mock_get_metabase = api_mocks.get_metabase
         mock_get_metabase.return_value = sample_metabase_data
         
         # Test with progress
@@ -208,61 +296,56 @@ class TestEurostatClient:
         # Should not raise an error
         client_no_cache.clear_cache()
     
-    @patch('eustatspy.catalogue.CatalogueAPI.get_table_of_contents')
-    @patch('eustatspy.catalogue.CatalogueAPI.get_dataset_info')
-    @patch('eustatspy.catalogue.CatalogueAPI.get_dataset_dimensions_from_metabase')
-    def test_describe_dataset(self, mock_get_dimensions, mock_get_info, mock_get_toc, 
-                            client_no_cache, sample_dataset_info, sample_metabase_data, 
-                            capsys):
+    def test_describe_dataset(self, api_mocks, client_no_cache, sample_dataset_info,
+                            sample_metabase_data):
         """Test describing a dataset."""
-        mock_get_info.return_value = sample_dataset_info
-        mock_get_dimensions.return_value = sample_metabase_data['nama_10_gdp']
-        
-        client_no_cache.describe_dataset('nama_10_gdp')
-        
-        captured = capsys.readouterr()
-        assert "Dataset: nama_10_gdp" in captured.out
-        assert "Title: Gross domestic product (GDP) and main components" in captured.out
-        assert "geo:" in captured.out
-        assert "time:" in captured.out
+        api_mocks.get_dataset_info.return_value = sample_dataset_info
+        api_mocks.get_dataset_dimensions_from_metabase.return_value = sample_metabase_data['nama_10_gdp']
+
+        with patch('sys.stdout') as mock_stdout:
+            client_no_cache.describe_dataset('nama_10_gdp')
+
+        out = "".join(call.args[0] for call in mock_stdout.write.call_args_list)
+        assert "Dataset: nama_10_gdp" in out
+        assert "Title: Gross domestic product (GDP) and main components" in out
+        assert "geo:" in out
+        assert "time:" in out
     
-    @patch('eustatspy.catalogue.CatalogueAPI.get_table_of_contents')
-    def test_browse_database_root(self, mock_get_toc, client_no_cache, sample_toc, capsys):
+    def test_browse_database_root(self, api_mocks, client_no_cache, sample_toc):
         """Test browsing database at root level."""
-        mock_get_toc.return_value = sample_toc
-        
-        client_no_cache.browse_database()
-        
-        captured = capsys.readouterr()
-        assert "Eurostat Database - Main Themes:" in captured.out
+        api_mocks.get_table_of_contents.return_value = sample_toc
+
+        with patch('sys.stdout') as mock_stdout:
+            client_no_cache.browse_database()
+
+        out = "".join(call.args[0] for call in mock_stdout.write.call_args_list)
+        assert "Eurostat Database - Main Themes:" in out
     
-    @patch('eustatspy.catalogue.CatalogueAPI.get_table_of_contents')
-    def test_browse_database_specific_folder(self, mock_get_toc, client_no_cache, sample_toc, capsys):
+    def test_browse_database_specific_folder(self, api_mocks, client_no_cache, sample_toc):
         """Test browsing specific folder in database."""
-        mock_get_toc.return_value = sample_toc
-        
-        client_no_cache.browse_database("data")
-        
-        captured = capsys.readouterr()
+        api_mocks.get_table_of_contents.return_value = sample_toc
+
+        with patch('sys.stdout') as mock_stdout:
+            client_no_cache.browse_database("data")
+
+        out = "".join(call.args[0] for call in mock_stdout.write.call_args_list)
         # The browse function shows "Eurostat Database - Main Themes:" for the data folder
-        assert "Eurostat Database - Main Themes:" in captured.out
+        assert "Eurostat Database - Main Themes:" in out
 
 
 class TestClientErrorHandling:
     """Test error handling in EurostatClient."""
     
-    @patch('eustatspy.statistics.StatisticsAPI.get_data_as_dataframe')
-    def test_data_retrieval_error(self, mock_get_data, client_no_cache):
+    def test_data_retrieval_error(self, api_mocks, client_no_cache):
         """Test handling of data retrieval errors."""
-        mock_get_data.side_effect = EurostatAPIError("API Error")
+        api_mocks.get_data_as_dataframe.side_effect = EurostatAPIError("API Error")
         
         with pytest.raises(EurostatAPIError):
             client_no_cache.get_data_as_dataframe('invalid_dataset')
     
-    @patch('eustatspy.catalogue.CatalogueAPI.get_metabase')
-    def test_preload_metabase_error(self, mock_get_metabase, client_no_cache):
+    def test_preload_metabase_error(self, api_mocks, client_no_cache):
         """Test handling of metabase loading errors."""
-        mock_get_metabase.side_effect = EurostatAPIError("Download failed")
+        api_mocks.get_metabase.side_effect = EurostatAPIError("Download failed")
         
         with pytest.raises(EurostatAPIError):
             client_no_cache.preload_metabase()
@@ -271,24 +354,10 @@ class TestClientErrorHandling:
 class TestClientWithRealishData:
     """Test client with more realistic data scenarios."""
     
-    @patch('eustatspy.statistics.StatisticsAPI.get_data_as_dataframe')
-    def test_multiple_filters(self, mock_get_data, client_no_cache):
+    def test_multiple_filters(self, api_mocks, client_no_cache, realistic_gdp_df):
         """Test data retrieval with multiple complex filters."""
-        # Create realistic DataFrame
-        df_data = []
-        for geo in ['SE', 'NO', 'DK']:
-            for time in ['2020', '2021', '2022']:
-                for unit in ['CP_MEUR', 'CLV20_MEUR']:
-                    df_data.append({
-                        'geo': geo,
-                        'geo_label': {'SE': 'Sweden', 'NO': 'Norway', 'DK': 'Denmark'}[geo],
-                        'time': time,
-                        'unit': unit,
-                        'value': 1000 + len(df_data)
-                    })
-        
-        mock_df = pd.DataFrame(df_data)
-        mock_get_data.return_value = mock_df
+        mock_get_data = api_mocks.get_data_as_dataframe
+        mock_get_data.return_value = realistic_gdp_df
         
         df = client_no_cache.get_data_as_dataframe(
             'nama_10_gdp',
@@ -91,6 +91,36 @@ class TestDatasetInfo:
         assert info1 == info2
         assert info1 != info3
     
+    def test_dataset_info_formatted_strings(self):
+        """Test the cached display strings for update date and value count."""
+        info = DatasetInfo(
+            code="nama_10_gdp",
+            title="GDP",
+            type="dataset",
+            last_update=datetime(2025, 6, 26, 12, 30),
+            values_count=1049888
+        )
+
+        assert info.last_update_str == "2025-06-26"
+        assert info.values_count_str == "1,049,888"
+        # Cached on repeat access despite the frozen dataclass
+        assert info.last_update_str == "2025-06-26"
+
+        empty = DatasetInfo(code="x", title="X", type="dataset")
+        assert empty.last_update_str == ""
+        assert empty.values_count_str == ""
+
+    def test_dataset_info_immutable(self):
+        """Test that DatasetInfo instances are frozen."""
+        info = DatasetInfo(
+            code="test_dataset",
+            title="Test Dataset",
+            type="dataset"
+        )
+
+        with pytest.raises(AttributeError):
+            info.title = "Changed"
+
     def test_dataset_info_repr(self):
         """Test DatasetInfo string representation."""
         info = DatasetInfo(
@@ -281,6 +311,27 @@ class TestTableOfContents:
         assert "dataset1" in toc.hierarchy["folder1"]
         assert "dataset2" in toc.hierarchy["folder1"]
     
+    def test_toc_children_by_type(self):
+        """Test the memoized per-parent folder/dataset partition."""
+        datasets = [
+            DatasetInfo(code="folder1", title="Folder 1", type="folder"),
+            DatasetInfo(code="dataset1", title="Dataset 1", type="dataset"),
+            DatasetInfo(code="dataset2", title="Dataset 2", type="dataset")
+        ]
+        hierarchy = {"data": ["folder1", "dataset1", "dataset2", "missing"]}
+
+        toc = TableOfContents(datasets=datasets, hierarchy=hierarchy)
+
+        folders, children = toc.children_by_type("data")
+        assert [d.code for d in folders] == ["folder1"]
+        assert [d.code for d in children] == ["dataset1", "dataset2"]
+
+        # Memoized: same tuple back on repeat calls
+        assert toc.children_by_type("data") is toc.children_by_type("data")
+
+        # Unknown parents partition to empty lists
+        assert toc.children_by_type("nonexistent") == ([], [])
+
     def test_toc_empty_hierarchy(self):
         """Test TableOfContents with empty hierarchy."""
         datasets = [DatasetInfo(code="dataset1", title="Dataset 1", type="dataset")]
@@ -3,24 +3,39 @@
 import pytest
 import pandas as pd
 import numpy as np
+import json
 from unittest.mock import patch, Mock
 import requests
 from eustatspy.statistics import StatisticsAPI
 from eustatspy.exceptions import EurostatAPIError, InvalidParameterError, DataParsingError
 
 
+class _FakeResponse:
+    """Minimal stand-in for requests.Response.
+
+    A slotted class with plain attributes is far cheaper to build and read
+    than a Mock, whose attribute access allocates child mocks on the fly.
+    """
+    __slots__ = ('status_code', 'text', 'content', 'headers', '_json')
+
+    def json(self):
+        return self._json
+
+
 def create_mock_response(data, status_code=200, content_type="application/json"):
     """Create a mock response object."""
-    mock_response = Mock()
+    mock_response = _FakeResponse()
     mock_response.status_code = status_code
-    
+    mock_response.headers = {}
+
     if content_type == "application/json":
-        mock_response.json.return_value = data
+        mock_response._json = data
+        mock_response.content = json.dumps(data).encode()
         mock_response.text = str(data) if not isinstance(data, str) else data
     else:
         mock_response.text = data
         mock_response.content = data.encode() if isinstance(data, str) else data
-    
+
     return mock_response
 
 
@@ -47,7 +62,7 @@ class TestStatisticsAPI:
         api.set_catalogue_reference(mock_catalogue)
         assert api.catalogue == mock_catalogue
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_data_success(self, mock_get, sample_jsonstat_response):
         """Test successful data retrieval."""
         api = StatisticsAPI()
@@ -70,7 +85,7 @@ class TestStatisticsAPI:
         assert ('geo', 'SE') in params
         assert ('time', '2020') in params
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_data_with_cache(self, mock_get, cache_instance, sample_jsonstat_response):
         """Test data retrieval with caching."""
         api = StatisticsAPI(cache=cache_instance)
@@ -86,7 +101,40 @@ class TestStatisticsAPI:
         assert mock_get.call_count == 1  # Still 1, used cache
         assert data1 == data2
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
+    def test_get_data_as_dataframe_cached(self, mock_get, cache_instance, sample_jsonstat_response):
+        """Test that the parsed DataFrame is cached alongside the raw JSON."""
+        api = StatisticsAPI(cache=cache_instance)
+        mock_response = create_mock_response(sample_jsonstat_response)
+        mock_get.return_value = mock_response
+
+        df1 = api.get_data_as_dataframe('nama_10_gdp', geo='SE')
+        assert mock_get.call_count == 1
+
+        # Second call loads the pickled frame without re-parsing JSON-stat
+        with patch.object(api, '_jsonstat_to_dataframe') as mock_convert:
+            df2 = api.get_data_as_dataframe('nama_10_gdp', geo='SE')
+            mock_convert.assert_not_called()
+
+        assert mock_get.call_count == 1
+        pd.testing.assert_frame_equal(df1, df2)
+
+    def test_get_many_as_dataframes(self, sample_jsonstat_response):
+        """Test fetching several datasets concurrently."""
+        api = StatisticsAPI()
+
+        with patch.object(api, 'get_data', return_value=sample_jsonstat_response):
+            dfs = api.get_many_as_dataframes(['nama_10_gdp', 'demo_pjan'], geo='SE')
+
+        assert list(dfs.keys()) == ['nama_10_gdp', 'demo_pjan']
+        for df in dfs.values():
+            assert isinstance(df, pd.DataFrame)
+            assert 'value' in df.columns
+
+        # Empty input short-circuits without spinning up a pool
+        assert api.get_many_as_dataframes([]) == {}
+
+    @patch('requests.Session.get')
     def test_get_data_asynchronous_response(self, mock_get):
         """Test handling of asynchronous response."""
         api = StatisticsAPI()
@@ -102,7 +150,7 @@ class TestStatisticsAPI:
         with pytest.raises(EurostatAPIError, match="asynchronously"):
             api.get_data('nama_10_gdp')
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_data_http_error(self, mock_get):
         """Test handling of HTTP errors."""
         api = StatisticsAPI()
@@ -297,7 +345,7 @@ class TestStatisticsAPI:
         with pytest.raises(DataParsingError):
             api._jsonstat_to_dataframe(invalid_jsonstat)
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_geo_categorical(self, mock_get, sample_geo_response):
         """Test getting geographical categorical data."""
         api = StatisticsAPI()
@@ -314,7 +362,7 @@ class TestStatisticsAPI:
         assert 'geo_categorical' in call_args[0][0]
         assert 'country' in call_args[0][0]
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_country_label(self, mock_get):
         """Test getting country label."""
         api = StatisticsAPI()
@@ -421,7 +469,7 @@ class TestStatisticsAPIEdgeCases:
         assert set(df['time'].unique()) == {'2020', '2021', '2022'}
         assert set(df['unit'].unique()) == {'EUR', 'USD'}
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_network_error_handling(self, mock_get):
         """Test handling of network errors."""
         api = StatisticsAPI()
@@ -430,13 +478,13 @@ class TestStatisticsAPIEdgeCases:
         with pytest.raises(EurostatAPIError, match="Failed to get data"):
             api.get_data('nama_10_gdp')
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_json_decode_error(self, mock_get):
         """Test handling of JSON decode errors."""
         api = StatisticsAPI()
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.side_effect = requests.exceptions.JSONDecodeError("Invalid JSON", "", 0)
+        mock_response.content = b"not valid json"
         mock_get.return_value = mock_response
         
         with pytest.raises(DataParsingError, match="Failed to parse JSON"):